@@ -57,7 +57,8 @@ class ControlMenu(QDialog):
         Args:
             name (str): Name of the audio file
             fs (int): Sampling frequency of the audio
-            audio (numpy.array): Audio signal data
+            audio (numpy.array): Audio signal data, expected as a contiguous
+                float32 array; it is stored as-is, not copied
             duration (float): Duration of the audio in seconds
             controller: Reference to the main application controller
         """
@@ -20,17 +20,28 @@ Version: 1.0
 
 
 import sys
-from PyQt5.QtWidgets import QToolButton, QWidgetAction, QHBoxLayout, QAction, QApplication, QMenuBar, QMenu, QMainWindow, QWidget, QVBoxLayout, QMenuBar, QMenu, QAction, QMessageBox, QDesktopWidget
-from PyQt5.QtCore import Qt
+from PyQt5.QtWidgets import QStackedWidget, QToolButton, QWidgetAction, QHBoxLayout, QAction, QApplication, QMenuBar, QMenu, QMainWindow, QWidget, QVBoxLayout, QMenuBar, QMenu, QAction, QMessageBox, QDesktopWidget
+from PyQt5.QtCore import Qt, QTimer, QSettings
 from PyQt5.QtGui import QIcon, QFont
 import matplotlib.pyplot as plt
 
 from misc.help import Help
+from misc import welcomeSettings
 
 # To avoid blurry fonts on Windows - DPI awareness for high resolution displays
 if sys.platform == "win32":
-    from ctypes import windll
-    windll.shcore.SetProcessDpiAwareness(1)
+    import ctypes
+    try:
+        # Per-monitor v2 (Windows 10+) lets Qt rescale on DPI changes without bitmap stretching
+        ctypes.windll.user32.SetProcessDpiAwarenessContext(ctypes.c_void_p(-4))
+    except (AttributeError, OSError):
+        try:
+            ctypes.windll.shcore.SetProcessDpiAwareness(1)
+        except (AttributeError, OSError):
+            pass  # Windows 7 or awareness already set for this process
+
+# Upper bound on pooled "Open windows" menu actions kept for reuse
+MAX_MENU_ENTRIES = 32
 
 # If in mac the menu bar is not at the top as by default but within the window.
 if sys.platform == "darwin":  # macOS
@@ -42,6 +53,136 @@ class Start(QMainWindow):
     Main application window for Signal Visualizer.
     Handles window initialization, menu creation, and frame management.
     """
+
+    # Static menus as (title, entries); entries are (text, tooltip, target)
+    # buttons or nested (title, entries) submenus
+    _MENU_SPEC = (
+        # Signal Visualizer menu - Application main options
+        ("Signal Visualizer", (
+            ("Info", "Show application information and instructions", 'Info'),
+            ("Exit", "Exit the application", '__exit__'),
+        )),
+        # Generate menu - Signal generation options
+        ("Generate", (
+            ("Pure tone", "Generate a single frequency sine wave", 'PureTone'),
+            ("Free addition of pure tones", "Combine multiple sine waves with custom frequencies",
+             'FreeAdditionPureTones'),
+            ("Noise", "Generate different types of noise signals", 'Noise'),
+            # Known periodic signals submenu
+            ("Known periodic signals", (
+                ("Square wave", "Generate a square wave signal", 'SquareWave'),
+                ("Sawtooth wave", "Generate a sawtooth wave signal", 'SawtoothWave'),
+            )),
+        )),
+        # Input menu - Audio input options
+        ("Input", (
+            ("Load", "Load an audio file from disk", 'Load'),
+            ("Record", "Record audio from your microphone", 'Record'),
+        )),
+        # Tuner menu - Audio analysis tools
+        ("Tuner", (
+            ("Live STFT", "Real-time frequency analysis for tuning instruments", 'Tuner'),
+        )),
+        # Examples menu - Pre-built demonstrations
+        ("Examples", (
+            ("Cretan Lute", "Example analysis of Cretan Lute audio", 'Cretan Lute'),
+        )),
+    )
+
+    _MENUBAR_QSS = """
+            /* Main menu bar */
+            QMenuBar {
+                background-color: #2c3e50;
+                color: white;
+                font-size: 1em;
+                font-weight: bold;
+                padding: 0.5em;
+                spacing: 0.5em;
+            }
+            QMenuBar::item {
+                background-color: transparent;
+                padding: 0.5em 1em;
+                border-radius: 0.25em;
+            }
+            QMenuBar::item:selected {
+                background-color: #3498db;
+            }
+            QMenuBar::item:pressed {
+                background-color: #2980b9;
+            }
+            
+            /* Dropdown menus */
+            QMenu {
+                background-color: #34495e;
+                color: white;
+                border: 1px solid #555;
+                padding: 0.25em;
+                font-size: 1em;
+                min-width: 12em;  /* Based on typical character width */
+            }
+            
+            /* Menu buttons */
+            QToolButton {
+                background-color: transparent;
+                color: white;
+                border: none;
+                padding: 0.75em 1.5em;
+                text-align: left;
+                min-width: 12em;
+                min-height: 2.25em;
+                font-size: 1em;
+            }
+            QToolButton:hover {
+                background-color: #3498db;
+                border-radius: 0.2em;
+            }
+            
+            /* Tooltips */
+            QToolTip {
+                background-color: #34495e;
+                color: white;
+                border: 1px solid #3498db;
+                padding: 0.5em;
+                border-radius: 0.25em;
+                font-size: 18pt;
+                opacity: 230;
+            }
+            /* Submenu items - make them match main menu height */
+            QMenu::item {
+                padding: 0.75em 1.5em;  /* Increased vertical padding */
+                min-height: 2.25em;      /* Explicit minimum height */
+            }
+            
+            /* Submenu indicators */
+            QMenu::indicator {
+                width: 1em;
+                height: 1em;
+            }
+            
+            /* Submenu itself */
+            QMenu::menu {
+                margin: 0.25em;  /* Slight margin around submenu */
+            }
+        """
+
+    # Font size and styling shared by every menu button
+    _MENU_BUTTON_POINT_SIZE = 15
+    _MENU_BUTTON_QSS = """
+            QToolButton {
+                background-color: transparent;
+                color: white;
+                border: none;
+                padding: 0.75em 1.5em;
+                text-align: left;
+                min-width: 12em;
+                min-height: 2.25em;
+                font-size: 16pt;    #hover message font size
+            }
+            QToolButton:hover {
+                background-color: #3498db;
+                border-radius: 0.2em;
+            }
+        """
     
     def __init__(self):
         """Initialize the main application window and its components."""
@@ -58,30 +199,49 @@ class Start(QMainWindow):
         self.layout = QVBoxLayout(self.container)
         self.container.setLayout(self.layout)
 
+        # All frames live in one stacked widget; switching pages only changes its index
+        self.stack = QStackedWidget(self.container)
+        self.layout.addWidget(self.stack)
+
         # Dictionary to hold frames (pages) of the application
         self.frames = {}
+        # Stack index of each page, so switching frames is a dict lookup
+        self._stack_index = {}
 
         # Track all open windows for the window management menu
         self.all_open_windows = {
             'control_menus': [],  # Will reference Load's control_windows
             'plot_windows': []    # Will reference ControlMenu's plot_windows
         }
+
+        # Reusable QActions for the "Open windows" menu, recycled on every rebuild
+        self._action_pool = []
+        self._active_actions = []
         
         # Initialize and show Info frame by default
         self.initialize_frame('Info')
-        self.show_welcome_dialog()
+        # Deferred so the main window paints before the welcome dialog appears
+        QTimer.singleShot(0, self.show_welcome_dialog)
 
         # Initialize Help system
         self.help = Help(self.container, self)
-        # Set up the menu bar
-        self.create_menu_bar()
+        # Build the menu bar once the window is on screen
+        QTimer.singleShot(0, self.create_menu_bar)
 
 
     def show_welcome_dialog(self):
-        """Display the welcome dialog on first run."""
+        """
+        Display the welcome dialog unless the user opted out of it.
+
+        The "Don't show this again" preference is read from QSettings before
+        the dialog module is imported, so returning users pay no cost for it.
+        """
+        settings = QSettings(welcomeSettings.SETTINGS_ORG, welcomeSettings.SETTINGS_APP)
+        if settings.value(welcomeSettings.DONT_SHOW_KEY, False, type=bool):
+            return
+
         from misc.popupinfo import FirstRunDialog
-        dialog = FirstRunDialog(self)
-        dialog.exec_()
+        FirstRunDialog.maybe_show(self)
 
     def center_window(self):
         """Center the window on the screen."""
@@ -149,10 +309,13 @@ class Start(QMainWindow):
         Args:
             page_name (str): Name of the frame/page to initialize
         """
-        # Clean up existing frame if it exists and has cleanup method
-        if page_name in self.frames and hasattr(self.frames[page_name], 'cleanup'):
-            self.frames[page_name].cleanup()
-        
+        # Clean up the frame being left (covers a previous instance of this page)
+        current_widget = self.stack.currentWidget()
+        if current_widget is not None and hasattr(current_widget, 'cleanup'):
+            current_widget.cleanup()
+
+        old_frame = self.frames.get(page_name)
+
         # Initialize the appropriate frame based on page_name
         if page_name == 'SignalVisualizer':
             self.frames['SignalVisualizer'] = SignalVisualizer(self.container, self)
@@ -188,6 +351,19 @@ class Start(QMainWindow):
         elif page_name == 'Cretan Lute':
             from utils.examples import BeatFrequencyVisualizer
             self.frames['Cretan Lute'] = BeatFrequencyVisualizer(self.container, self)
+
+        frame = self.frames.get(page_name)
+        if frame is None:
+            return
+
+        if old_frame is not None:
+            # Replace the previous instance in place so other indices stay valid
+            index = self._stack_index[page_name]
+            self.stack.removeWidget(old_frame)
+            old_frame.deleteLater()
+            self.stack.insertWidget(index, frame)
+        else:
+            self._stack_index[page_name] = self.stack.addWidget(frame)
         
         # Show the initialized frame
         self.show_frame(page_name)
@@ -199,139 +375,19 @@ class Start(QMainWindow):
         Args:
             page_name (str): Name of the frame/page to display
         """
-        if page_name in self.frames:
-            # Clean up current frame if it exists and has cleanup method
-            current_widget = self.layout.itemAt(0).widget() if self.layout.count() > 0 else None
-            if current_widget and hasattr(current_widget, 'cleanup'):
-                current_widget.cleanup()
-            
-            # Remove the current widget from the layout
-            for i in reversed(range(self.layout.count())):
-                widget = self.layout.itemAt(i).widget()
-                widget.setParent(None)
-                if hasattr(widget, 'cleanup'):  # Additional safety check
-                    widget.cleanup()
-            
-            # Add the new frame to the layout
-            self.layout.addWidget(self.frames[page_name])
-            self.frames[page_name].setVisible(True)
+        index = self._stack_index.get(page_name)
+        if index is not None:
+            self.stack.setCurrentIndex(index)
 
     def create_menu_bar(self):
         """Create the menu bar with button-style dropdown items that support tooltips."""
         menubar = self.menuBar()
         
         # Apply stylesheet for consistent styling across the menu bar
-        menubar.setStyleSheet("""
-            /* Main menu bar */
-            QMenuBar {
-                background-color: #2c3e50;
-                color: white;
-                font-size: 1em;
-                font-weight: bold;
-                padding: 0.5em;
-                spacing: 0.5em;
-            }
-            QMenuBar::item {
-                background-color: transparent;
-                padding: 0.5em 1em;
-                border-radius: 0.25em;
-            }
-            QMenuBar::item:selected {
-                background-color: #3498db;
-            }
-            QMenuBar::item:pressed {
-                background-color: #2980b9;
-            }
-            
-            /* Dropdown menus */
-            QMenu {
-                background-color: #34495e;
-                color: white;
-                border: 1px solid #555;
-                padding: 0.25em;
-                font-size: 1em;
-                min-width: 12em;  /* Based on typical character width */
-            }
-            
-            /* Menu buttons */
-            QToolButton {
-                background-color: transparent;
-                color: white;
-                border: none;
-                padding: 0.75em 1.5em;
-                text-align: left;
-                min-width: 12em;
-                min-height: 2.25em;
-                font-size: 1em;
-            }
-            QToolButton:hover {
-                background-color: #3498db;
-                border-radius: 0.2em;
-            }
-            
-            /* Tooltips */
-            QToolTip {
-                background-color: #34495e;
-                color: white;
-                border: 1px solid #3498db;
-                padding: 0.5em;
-                border-radius: 0.25em;
-                font-size: 18pt;
-                opacity: 230;
-            }
-            /* Submenu items - make them match main menu height */
-            QMenu::item {
-                padding: 0.75em 1.5em;  /* Increased vertical padding */
-                min-height: 2.25em;      /* Explicit minimum height */
-            }
-            
-            /* Submenu indicators */
-            QMenu::indicator {
-                width: 1em;
-                height: 1em;
-            }
-            
-            /* Submenu itself */
-            QMenu::menu {
-                margin: 0.25em;  /* Slight margin around submenu */
-            }
-        """)
-
+        menubar.setStyleSheet(self._MENUBAR_QSS)
 
-        # Signal Visualizer menu - Application main options
-        signal_menu = menubar.addMenu("Signal Visualizer")
-        self._add_menu_button(signal_menu, "Info", "Show application information and instructions", 
-                            lambda: self.initialize_frame('Info'))
-        self._add_menu_button(signal_menu, "Exit", "Exit the application", self.close)
-
-        # Generate menu - Signal generation options
-        generate_menu = menubar.addMenu("Generate")
-        self._add_menu_button(generate_menu, "Pure tone", "Generate a single frequency sine wave",
-                             lambda: self.initialize_frame('PureTone'))
-        self._add_menu_button(generate_menu, "Free addition of pure tones", 
-                            "Combine multiple sine waves with custom frequencies",
-                            lambda: self.initialize_frame('FreeAdditionPureTones'))
-        self._add_menu_button(generate_menu, "Noise", "Generate different types of noise signals",
-                             lambda: self.initialize_frame('Noise'))
-
-        # Known periodic signals submenu
-        known_menu = generate_menu.addMenu("Known periodic signals")
-        self._add_menu_button(known_menu, "Square wave", "Generate a square wave signal",
-                             lambda: self.initialize_frame('SquareWave'))
-        self._add_menu_button(known_menu, "Sawtooth wave", "Generate a sawtooth wave signal",
-                             lambda: self.initialize_frame('SawtoothWave'))
-
-        # Input menu - Audio input options
-        input_menu = menubar.addMenu("Input")
-        self._add_menu_button(input_menu, "Load", "Load an audio file from disk",
-                             lambda: self.initialize_frame('Load'))
-        self._add_menu_button(input_menu, "Record", "Record audio from your microphone",
-                             lambda: self.initialize_frame('Record'))
-
-        # Tuner menu - Audio analysis tools
-        tuner_menu = menubar.addMenu("Tuner")
-        self._add_menu_button(tuner_menu, "Live STFT", "Real-time frequency analysis for tuning instruments",
-                             lambda: self.initialize_frame('Tuner'))
+        # Build all static menus from the declarative spec in one pass
+        self._build_menus_from_spec(menubar, self._MENU_SPEC)
         '''
         # Tools menu - Additional analysis tools (commented out)
         tools_menu = menubar.addMenu("Tools")
@@ -340,11 +396,6 @@ class Start(QMainWindow):
                             lambda: self.show_separator_tool())
         '''
 
-        # Examples menu - Pre-built demonstrations
-        examples_menu = menubar.addMenu("Examples")
-        self._add_menu_button(examples_menu, "Cretan Lute", "Example analysis of Cretan Lute audio",
-                             lambda: self.initialize_frame('Cretan Lute'))
-
         # Open windows menu - Window management
         windows_menu = menubar.addMenu("Open windows")
         
@@ -362,11 +413,37 @@ class Start(QMainWindow):
                              lambda: self.initialize_frame('Spectrogram'))
         '''
 
+    def _build_menus_from_spec(self, parent, spec):
+        """
+        Populate menus from a nested (title, entries) specification.
+        
+        Each entry is either a (text, tooltip, target) button, where target is
+        a frame page name or '__exit__', or a (title, entries) submenu.
+        
+        Args:
+            parent: Menu bar or menu to add the menus to
+            spec: Tuple of (title, entries) pairs
+        """
+        for title, entries in spec:
+            menu = parent.addMenu(title)
+            for entry in entries:
+                if len(entry) == 2:
+                    # Nested submenu
+                    self._build_menus_from_spec(menu, (entry,))
+                    continue
+                text, tooltip, target = entry
+                if target == '__exit__':
+                    callback = self.close
+                else:
+                    callback = lambda _=False, page=target: self.initialize_frame(page)
+                self._add_menu_button(menu, text, tooltip, callback)
+
     def update_windows_menu(self):
         """Update the windows menu with current open windows dynamically."""
         # Clear existing menus to refresh the list
         self.control_windows_menu.clear()
         self.plot_windows_menu.clear()
+        self._release_actions()
         
         # Collect control windows from all sources
         control_windows, plot_windows = self.get_all_open_windows()
@@ -381,8 +458,7 @@ class Start(QMainWindow):
                 icon = "📁"   # Folder for loaded files
             
             # Create action for each control window
-            action = QAction(f"{i}. {icon} {title}", self)
-            action.triggered.connect(lambda _, w=window: self.focus_window(w))
+            action = self._acquire_action(f"{i}. {icon} {title}", window)
             self.control_windows_menu.addAction(action)
             
         # Add plot windows with grouping by their parent control window
@@ -402,18 +478,45 @@ class Start(QMainWindow):
                     icon = "📁"
                 
                 # Add clickable header for the control window
-                header = QAction(f"📌 {icon} {title}", self)
-                header.setFont(QFont("Arial", weight=QFont.Bold))
-                header.triggered.connect(lambda _, w=ctrl_window: self.focus_window(w))
+                header = self._acquire_action(f"📌 {icon} {title}", ctrl_window,
+                                              QFont("Arial", weight=QFont.Bold))
                 self.plot_windows_menu.addAction(header)
                 
                 # Add plot windows for this control window
                 for plot_window in ctrl_window.plot_windows:
-                    action = QAction(f"    {plot_count}. {plot_window.windowTitle()}", self)
-                    action.triggered.connect(lambda _, w=plot_window: self.focus_window(w))
+                    action = self._acquire_action(f"    {plot_count}. {plot_window.windowTitle()}", plot_window)
                     self.plot_windows_menu.addAction(action)
                     plot_count += 1
 
+    def _acquire_action(self, text, window, font=None):
+        """
+        Take a QAction from the pool (or create one) that focuses a window.
+        
+        Args:
+            text (str): Menu entry text
+            window: The window to focus when the action is triggered
+            font (QFont): Optional font, defaults to the application font
+            
+        Returns:
+            QAction: The configured action
+        """
+        action = self._action_pool.pop() if self._action_pool else QAction(self)
+        action.setText(text)
+        action.setFont(font if font is not None else QFont())
+        action.triggered.connect(lambda _, w=window: self.focus_window(w))
+        self._active_actions.append(action)
+        return action
+
+    def _release_actions(self):
+        """Disconnect the actions of the previous menu build and return them to the pool."""
+        for action in self._active_actions:
+            action.triggered.disconnect()
+            if len(self._action_pool) < MAX_MENU_ENTRIES * 2:
+                self._action_pool.append(action)
+            else:
+                action.deleteLater()  # Pool is full, let Qt free the excess
+        self._active_actions = []
+
     def focus_window(self, window):
         """
         Bring a window to focus.
@@ -446,26 +549,11 @@ class Start(QMainWindow):
 
         # ONLY CHANGE THE FONT SIZE - keep other styling original
         font = button.font()
-        font.setPointSize(15)  # Adjust this value as needed (default is usually 9-10)
+        font.setPointSize(self._MENU_BUTTON_POINT_SIZE)
         button.setFont(font)
 
         # Apply styling to the button
-        button.setStyleSheet("""
-            QToolButton {
-                background-color: transparent;
-                color: white;
-                border: none;
-                padding: 0.75em 1.5em;
-                text-align: left;
-                min-width: 12em;
-                min-height: 2.25em;
-                font-size: 16pt;    #hover message font size
-            }
-            QToolButton:hover {
-                background-color: #3498db;
-                border-radius: 0.2em;
-            }
-        """)
+        button.setStyleSheet(self._MENU_BUTTON_QSS)
         button.clicked.connect(callback)
         action.setDefaultWidget(button)
         menu.addAction(action)
@@ -528,6 +616,11 @@ class Start(QMainWindow):
             QMessageBox.No,
         )
         if reply == QMessageBox.Yes:
+            # Let the current page release its resources (audio streams, temp files)
+            current_widget = self.stack.currentWidget()
+            if current_widget is not None and hasattr(current_widget, 'cleanup'):
+                current_widget.cleanup()
+            
             # Close all open windows first
             self.close_all_windows()
             
@@ -12,7 +12,7 @@ Key Features:
 
 Dependencies:
 - PyQt5: Graphical user interface components
-- PyQt5.QtWebEngineWidgets: HTML content rendering
+- PyQt5.QtWebEngineWidgets: Optional HTML rendering (only when USE_WEB_ENGINE is set)
 - os: File path operations
 
 Author: Matteo Tsikalakis-Reeder
@@ -20,14 +20,58 @@ Date: 25/09/2025
 Version: 1.0
 """
 
+import logging
 import os
 import sys
+import threading
+from collections import OrderedDict
 
 from PyQt5.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, QRadioButton, 
-                            QWidget, QFrame, QLabel)
-from PyQt5.QtCore import Qt, pyqtSignal
-from PyQt5.QtWebEngineWidgets import QWebEngineView
-from PyQt5.QtCore import QUrl
+                            QWidget, QFrame, QTextBrowser, QButtonGroup)
+from PyQt5.QtCore import Qt, QUrl, QTimer, QRunnable, QThreadPool
+
+logger = logging.getLogger(__name__)
+
+# Maximum number of help pages kept in memory after their first load
+HTML_CACHE_SIZE = 8
+
+# Size limit of the on-disk web engine cache shared by all help pages
+WEB_CACHE_MAX_BYTES = 16 * 1024 * 1024
+
+# The help pages are static HTML, which QTextBrowser renders without starting
+# a Chromium process. Set to True for pages that need the full web engine.
+USE_WEB_ENGINE = False
+
+# Delay after startup before the help pages are read in the background (ms)
+PREFETCH_DELAY_MS = 2000
+
+
+class _HelpPrefetch(QRunnable):
+    """
+    Background task that reads the help HTML files into the page cache.
+    
+    Only pages that are not cached yet are read, so a topic opened by the
+    user before the task runs is left untouched.
+    """
+
+    def __init__(self, help_widget):
+        super().__init__()
+        self.help_widget = help_widget
+
+    def run(self):
+        helper = self.help_widget
+        for value, path in helper.html_paths.items():
+            if value in helper._html_cache or not helper._exists.get(value, False):
+                continue
+            try:
+                with open(path, 'rb') as file:
+                    content = file.read()
+            except OSError as e:
+                logger.debug("Could not prefetch help page %d: %s", value, e)
+                continue
+            # Only fill free slots; never push out a page the user opened
+            helper._cache_page(value, (content, helper._base_urls[value]), prefetch=True)
+
 
 class Help(QWidget):
     """
@@ -43,10 +87,27 @@ class Help(QWidget):
         controller: Reference to main application controller
         help_window: Main help dialog window instance
         html_paths: Dictionary mapping topic IDs to HTML file paths
-        radio_group: List of radio button widgets for topic selection
-        web_view: QWebEngineView for displaying HTML content
+        _bg: QButtonGroup of the topic radio buttons, keyed by topic ID
+        web_view: QTextBrowser (or QWebEngineView) for displaying HTML content
+        _html_cache: LRU OrderedDict of topic ID to (raw HTML bytes, base QUrl)
+        _cache_lock: Guards _html_cache against the background prefetch
+        _base_urls: Topic ID to precomputed base QUrl of the page directory
+        _exists: Topic ID to whether its HTML file was found at startup
+        _profile: Shared QWebEngineProfile, only created when USE_WEB_ENGINE is set
     """
 
+    # Radio button labels, indexed by help topic ID - 1
+    _BUTTON_TEXTS = (
+        "Pure Tone",
+        "Harmonic Synthesis",
+        "Square Wave",
+        "Sawtooth Wave",
+        "Noise Generation",
+        "Load Audio File",
+        "Record Audio",
+        "Visualization",
+    )
+
     def __init__(self, controller, parent=None):
         """
         Initialize the Help system widget.
@@ -79,6 +140,26 @@ class Help(QWidget):
             8: os.path.join(base_path, 'html', 'en', 'visualization_window', 'Visualizationwindow.html')
         }
 
+        # The help files are fixed at install time, so check them and build
+        # their base URLs once instead of on every topic click
+        self._base_urls = {k: QUrl.fromLocalFile(os.path.dirname(v) + '/')
+                           for k, v in self.html_paths.items()}
+        self._exists = {k: os.path.exists(v) for k, v in self.html_paths.items()}
+
+        # Raw page contents are cached so repeated topic clicks skip the disk read
+        self._html_cache = OrderedDict()
+        self._cache_lock = threading.Lock()
+
+        # Web engine profile shared by every help view, created on first use
+        self._profile = None
+
+        # Read the pages off the UI thread once startup has settled
+        QTimer.singleShot(PREFETCH_DELAY_MS, self._prefetch)
+
+    def _prefetch(self):
+        """Queue a background read of all help pages into the page cache."""
+        QThreadPool.globalInstance().start(_HelpPrefetch(self))
+
 
     def createHelpMenu(self, value):
         """
@@ -92,6 +173,8 @@ class Help(QWidget):
         """
         if self.help_window is None:
             self.help_window = QDialog(self)
+            # Release the dialog and its viewer on close instead of waiting for GC
+            self.help_window.setAttribute(Qt.WA_DeleteOnClose, True)
             self.help_window.setWindowTitle('Help Menu')
             # Remove context help button from title bar
             self.help_window.setWindowFlags(self.help_window.windowFlags() & ~Qt.WindowContextHelpButtonHint)
@@ -106,20 +189,29 @@ class Help(QWidget):
             left_layout = QVBoxLayout()
             left_layout.setSpacing(5)  # Compact spacing between buttons
             
-            # Create radio buttons for all help topics
-            self.radio_group = []
+            # Create radio buttons for all help topics; the group keeps them
+            # mutually exclusive and maps topic IDs back to buttons
+            self._bg = QButtonGroup(self.help_window)
             for i in range(1, 9):
                 radio = QRadioButton(self.get_button_text(i))
                 radio.setChecked(i == value)  # Select initial topic
-                radio.clicked.connect(self.create_radio_handler(i))
+                radio.setProperty("topic_id", i)
+                radio.clicked.connect(self._on_radio_clicked)
                 left_layout.addWidget(radio)
-                self.radio_group.append(radio)
+                self._bg.addButton(radio, i)
             
             left_panel.setLayout(left_layout)
             main_layout.addWidget(left_panel)
             
             # Right panel for HTML content display
-            self.web_view = QWebEngineView()
+            if USE_WEB_ENGINE:
+                # Imported here so Chromium is only loaded when actually used
+                from PyQt5.QtWebEngineWidgets import QWebEngineView, QWebEnginePage
+                self.web_view = QWebEngineView()
+                self.web_view.setPage(QWebEnginePage(self.get_web_profile(), self.web_view))
+            else:
+                self.web_view = QTextBrowser()
+                self.web_view.setOpenExternalLinks(True)
             main_layout.addWidget(self.web_view, 1)  # Web view gets most space
             
             self.help_window.setLayout(main_layout)
@@ -131,30 +223,45 @@ class Help(QWidget):
         self.help_window.raise_()
         self.help_window.activateWindow()
 
+    def get_web_profile(self):
+        """
+        Return the web engine profile shared by all help views.
+        
+        The profile keeps a disk HTTP cache so images and stylesheets used
+        by several help pages are only parsed from source once.
+        
+        Returns:
+            QWebEngineProfile: The shared "help" profile
+        """
+        if self._profile is None:
+            from PyQt5.QtWebEngineWidgets import QWebEngineProfile
+            from PyQt5.QtCore import QStandardPaths
+
+            cache_dir = os.path.join(
+                QStandardPaths.writableLocation(QStandardPaths.CacheLocation), 'help')
+            self._profile = QWebEngineProfile("help", self)
+            self._profile.setHttpCacheType(QWebEngineProfile.DiskHttpCache)
+            self._profile.setCachePath(cache_dir)
+            self._profile.setHttpCacheMaximumSize(WEB_CACHE_MAX_BYTES)
+        return self._profile
+
     def on_help_close(self):    
         """
         Clean up when help window is closed.
         
-        Resets the help_window reference to allow recreation
-        and provides optional debug output.
+        Resets the help_window reference to allow recreation; the dialog
+        itself is deleted by Qt because of WA_DeleteOnClose.
         """
         self.help_window = None
-        print("Help window closed")  # Optional debug output
 
-    def create_radio_handler(self, value):
+    def _on_radio_clicked(self):
         """
-        Create a radio button click handler for specific help topic.
+        Show the help topic of the radio button that was clicked.
         
-        Args:
-            value: Help topic ID for this radio button
-            
-        Returns:
-            function: Configured click handler function
+        All topic radios share this slot; each one carries its topic ID
+        in the "topic_id" property.
         """
-        def handler():
-            print(f"Loading help page {value}")
-            self.show_help(value)
-        return handler
+        self.show_help(self.sender().property("topic_id"))
 
     def show_help(self, value):
         """
@@ -169,37 +276,77 @@ class Help(QWidget):
         if not self.help_window:  # Safety check if window was closed
                 return
 
-        print(f"Loading help page {value}")  # Debug output
+        logger.debug("Loading help page %d", value)
 
-        html_file = self.html_paths.get(value)
-        if html_file and os.path.exists(html_file):
+        with self._cache_lock:
+            cached = self._html_cache.get(value)
+            if cached is not None:
+                self._html_cache.move_to_end(value)  # Mark as most recently used
+        if cached is None:
+            if not self._exists.get(value, False):
+                # File not found → show error in the web view
+                self.set_page_html(
+                    f"<h1>Not Found</h1><p>Help page {value} is missing.</p>"
+                )
+                return
             try:
-                # Absolute path is already set in self.html_paths
-                base_dir = os.path.dirname(html_file)
-
-                # Read HTML content with UTF-8 encoding
-                with open(html_file, 'r', encoding='utf-8') as file:
+                # Read raw bytes once; decoding happens when the page is shown
+                with open(self.html_paths[value], 'rb') as file:
                     html_content = file.read()
-
-                # Set base URL for relative resource paths (images, CSS, etc.)
-                base_url = QUrl.fromLocalFile(base_dir + '/')
-                self.web_view.setHtml(html_content, base_url)
-
-                # Update radio button selection state
-                for i, radio in enumerate(self.radio_group, start=1):
-                    radio.setChecked(i == value)
-
             except Exception as e:
                 print(f"Error loading help content: {str(e)}")
-                self.web_view.setHtml(
+                self.set_page_html(
                     f"<h1>Error</h1><p>Could not load help page: {str(e)}</p>"
                 )
-        else:
-            # File not found → show error in the web view
-            self.web_view.setHtml(
-                f"<h1>Not Found</h1><p>Help page {value} is missing.</p>"
-            )
+                return
+
+            # Base URL for relative resource paths (images, CSS, etc.)
+            cached = (html_content, self._base_urls[value])
+            self._cache_page(value, cached)
 
+        html_content, base_url = cached
+        self.set_page_html(html_content.decode('utf-8'), base_url)
+
+        # Sync the selection when the topic was changed from code; a user
+        # click has already checked the button
+        radio = self._bg.button(value)
+        if radio is not None and not radio.isChecked():
+            radio.setChecked(True)
+
+
+    def _cache_page(self, value, entry, prefetch=False):
+        """
+        Insert a page into the LRU cache, evicting the least recently used.
+        
+        Args:
+            value: Help topic ID
+            entry: (raw HTML bytes, base QUrl) tuple
+            prefetch: Only insert if the page is missing and there is room
+        """
+        with self._cache_lock:
+            if prefetch and (value in self._html_cache
+                             or len(self._html_cache) >= HTML_CACHE_SIZE):
+                return
+            self._html_cache[value] = entry
+            self._html_cache.move_to_end(value)
+            while len(self._html_cache) > HTML_CACHE_SIZE:
+                self._html_cache.popitem(last=False)
+
+    def set_page_html(self, html_content, base_url=None):
+        """
+        Display HTML in whichever viewer widget is in use.
+        
+        Args:
+            html_content: HTML text to display
+            base_url: QUrl of the page directory for relative resources (optional)
+        """
+        if USE_WEB_ENGINE:
+            self.web_view.setHtml(html_content, base_url if base_url is not None else QUrl())
+        else:
+            # QTextBrowser resolves relative images through its search paths
+            if base_url is not None:
+                self.web_view.setSearchPaths([base_url.toLocalFile()])
+            self.web_view.setHtml(html_content)
 
     def get_button_text(self, value):
         """
@@ -211,14 +358,6 @@ class Help(QWidget):
         Returns:
             str: Human-readable topic name
         """
-        help_topics = {
-            1: "Pure Tone",
-            2: "Harmonic Synthesis",
-            3: "Square Wave",
-            4: "Sawtooth Wave", 
-            5: "Noise Generation",
-            6: "Load Audio File",
-            7: "Record Audio",
-            8: "Visualization"
-        }
-        return help_topics.get(value, f"Help {value}")
\ No newline at end of file
+        if 1 <= value <= len(self._BUTTON_TEXTS):
+            return self._BUTTON_TEXTS[value - 1]
+        return f"Help {value}"
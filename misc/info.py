@@ -18,7 +18,7 @@ Date: 25/09/2025
 Version: 1.0
 """
 
-from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QLabel, QFrame)
+from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QLabel)
 from PyQt5.QtCore import Qt
 
 class Info(QWidget):
@@ -73,8 +73,7 @@ class Info(QWidget):
         # Institutional collaboration description
         intro = QLabel("A collaboration between University of the Basque Country (UPV/EHU)\nand Musikene, Higher School of Music of the Basque Country.")
         
-        # Create a framed section for team member information
-        people_frame = QFrame()
+        # Sub-layout for team member information
         people_layout = QVBoxLayout()
         
         def create_label_pair(role, name):
@@ -103,8 +102,6 @@ class Info(QWidget):
         for widget in [leader_role, leader_name, contact_role, contact_name, 
                       dev_role, dev_name, icon_role, icon_name]:
             people_layout.addWidget(widget)
-            
-        people_frame.setLayout(people_layout)
         
         # References and acknowledgments section
         aholab = QLabel("\nHiTZ Basque Center for Language Technologies - Aholab Signal Processing Laboratory (UPV/EHU).\n")
@@ -117,7 +114,10 @@ class Info(QWidget):
         ref2 = QLabel("Master thesis describing the version of the software Signal Visualizer in Matlab made by Eder del Blanco Sierra:\nEder del Blanco Sierra (2020). Programa de apoyo a la enseñanza musical.\nUniversity of the Basque Country (UPV/EHU). Department of Communications Engineering. Retrieved August 8, 2020.\nThe function has been modified by Valentin Lurier and Mikel Díez García.")
         
         # Add all widgets to the main layout in order
-        for widget in [title, intro, people_frame, aholab, references, ref1, ref2]:
+        for widget in [title, intro]:
+            layout.addWidget(widget)
+        layout.addLayout(people_layout)
+        for widget in [aholab, references, ref1, ref2]:
             layout.addWidget(widget)
             
         self.setLayout(layout)  # Apply the layout to the widget
\ No newline at end of file
@@ -20,9 +20,45 @@ Date: 25/09/2025
 Version: 1.0
 """
 
+from html import escape
+
 from PyQt5.QtWidgets import (QSizePolicy, QWidget, QDialog, QLabel, QVBoxLayout, QPushButton, 
                              QScrollArea, QGroupBox, QCheckBox)
-from PyQt5.QtCore import QSettings, Qt
+from PyQt5.QtCore import QSettings, Qt, QTimer
+
+from misc import welcomeSettings
+
+# Static welcome message shown at the top of the dialog
+WELCOME_HTML = """
+<div style="
+    background-color: #f0f8ff;
+    padding: 15px;
+    border-radius: 8px;
+    border: 1px solid #d3d3d3;
+    margin-bottom: 10px;
+">
+    <h1 style="color: #2c3e50; margin-top: 0; text-align: center;">
+        Welcome to Signal Visualizer <span style="font-size: 0.7em;">(Beta Version)</span>
+    </h1>
+    
+    <div style="background-color: white; padding: 12px; border-radius: 6px; margin: 10px 0;">
+        <h3 style="color: #3498db; margin-top: 0;">Some notes:</h3>
+        <ul style="margin: 5px 0; padding-left: 25px;">
+            <li style="margin-bottom: 8px;"><b>Waveform interaction:</b> Click-hold and select a span to play any waveform</li>
+            <li style="margin-bottom: 8px;"><b>Save function:</b> you can save to .csv from the Control Menu</li>
+            <li style="margin-bottom: 8px;"><b>Help pages/examples explanation:</b> Will be added when we reach final version</li>
+            <li style="margin-bottom: 8px;"><b>Examples page:</b> If you go full screen, in case the GUI is a little faulty just click "Replot".</li>
+            <li style="margin-bottom: 8px;"><b>If in generator</b> the signal seem short (so you can visualize them better) set duration from below</li>
+        </ul>
+    </div>
+    <p style="font-style: italic; color: #7f8c8d; text-align: center; margin-bottom: 0;">
+        Thank you for testing our beta version! Your feedback is valuable.
+    </p>
+    <p style="font-size: 0.5em;color: #3498db; text-align: center; margin-bottom: 0;">
+        For any issues/problems/questions contact csd4058@csd.uoc.gr
+    </p>
+</div>
+"""
 
 class FirstRunDialog(QDialog):
     """
@@ -42,6 +78,37 @@ class FirstRunDialog(QDialog):
         dont_show_checkbox: Checkbox for persistent preference
     """
 
+    # QSettings location and key of the "Don't show this again" preference
+    SETTINGS_ORG = welcomeSettings.SETTINGS_ORG
+    SETTINGS_APP = welcomeSettings.SETTINGS_APP
+    DONT_SHOW_KEY = welcomeSettings.DONT_SHOW_KEY
+
+    @classmethod
+    def maybe_show(cls, parent=None):
+        """
+        Open the dialog unless the user opted out of it.
+        
+        The preference is checked before any widget is created, so
+        returning users pay nothing for the dialog. The checkbox state
+        is saved when the dialog is dismissed.
+        
+        Args:
+            parent: Parent widget (optional)
+            
+        Returns:
+            FirstRunDialog or None: The opened dialog, or None if suppressed
+        """
+        settings = QSettings(cls.SETTINGS_ORG, cls.SETTINGS_APP)
+        if settings.value(cls.DONT_SHOW_KEY, False, type=bool):
+            return None
+
+        dialog = cls(parent)
+        dialog.finished.connect(
+            lambda _: settings.setValue(cls.DONT_SHOW_KEY, dialog.dont_show_checkbox.isChecked())
+        )
+        dialog.open()  # Window-modal but non-blocking
+        return dialog
+
     def __init__(self, parent=None):
         """
         Initialize the First Run Dialog.
@@ -50,6 +117,8 @@ class FirstRunDialog(QDialog):
             parent: Parent widget (optional)
         """
         super().__init__(parent)
+        # Free the whole widget tree as soon as the dialog is dismissed
+        self.setAttribute(Qt.WA_DeleteOnClose, True)
         self.setWindowTitle("Welcome to Signal Visualizer")
         self.resize(600, 500)  # Reasonable default size
         
@@ -59,36 +128,8 @@ class FirstRunDialog(QDialog):
         main_layout.setSpacing(10)
         
         # Welcome message - fixed at top (non-scrolling)
-        welcome_label = QLabel("""
-            <div style="
-                background-color: #f0f8ff;
-                padding: 15px;
-                border-radius: 8px;
-                border: 1px solid #d3d3d3;
-                margin-bottom: 10px;
-            ">
-                <h1 style="color: #2c3e50; margin-top: 0; text-align: center;">
-                    Welcome to Signal Visualizer <span style="font-size: 0.7em;">(Beta Version)</span>
-                </h1>
-                
-                <div style="background-color: white; padding: 12px; border-radius: 6px; margin: 10px 0;">
-                    <h3 style="color: #3498db; margin-top: 0;">Some notes:</h3>
-                    <ul style="margin: 5px 0; padding-left: 25px;">
-                        <li style="margin-bottom: 8px;"><b>Waveform interaction:</b> Click-hold and select a span to play any waveform</li>
-                        <li style="margin-bottom: 8px;"><b>Save function:</b> you can save to .csv from the Control Menu</li>
-                        <li style="margin-bottom: 8px;"><b>Help pages/examples explanation:</b> Will be added when we reach final version</li>
-                        <li style="margin-bottom: 8px;"><b>Examples page:</b> If you go full screen, in case the GUI is a little faulty just click "Replot".</li>
-                        <li style="margin-bottom: 8px;"><b>If in generator</b> the signal seem short (so you can visualize them better) set duration from below</li>
-                    </ul>
-                </div>
-                <p style="font-style: italic; color: #7f8c8d; text-align: center; margin-bottom: 0;">
-                    Thank you for testing our beta version! Your feedback is valuable.
-                </p>
-                <p style="font-size: 0.5em;color: #3498db; text-align: center; margin-bottom: 0;">
-                    For any issues/problems/questions contact csd4058@csd.uoc.gr
-                </p>
-            </div>
-        """)
+        welcome_label = QLabel(WELCOME_HTML)
+        welcome_label.setTextFormat(Qt.RichText)  # Skip Qt's plain/rich text detection
         welcome_label.setWordWrap(True)
         main_layout.addWidget(welcome_label)
 
@@ -104,14 +145,57 @@ class FirstRunDialog(QDialog):
         content_layout.setContentsMargins(5, 5, 5, 5)
         content_layout.setSpacing(15)
 
+        # Placeholder until the sections are built after the first paint
+        self._content_layout = content_layout
+        self._sections_built = False
+        self._placeholder = QLabel("Loading…")
+        content_layout.addWidget(self._placeholder)
+
+        # Set all size constraints before handing the widget to the scroll
+        # area so its geometry is only computed once
+        content_widget.setSizePolicy(QSizePolicy.Preferred, QSizePolicy.MinimumExpanding)
+        content_widget.setMinimumSize(500, 400)  # Minimum size to ensure scroll appears
+        scroll.setWidget(content_widget)
+        main_layout.addWidget(scroll)
+
+        # Bottom controls section
+        self.dont_show_checkbox = QCheckBox("Don't show this again")
+        main_layout.addWidget(self.dont_show_checkbox)
+
+        # Action button
+        close_button = QPushButton("Get Started")
+        close_button.clicked.connect(self.accept)  # Close dialog on click
+        main_layout.addWidget(close_button)
+
+        # Build the menu sections once the dialog is on screen
+        QTimer.singleShot(0, self._build_sections)
+
+    def _build_sections(self):
+        """
+        Build the menu overview sections (runs once).
+        
+        Deferred from __init__ so the dialog appears before the bulk of
+        its widgets are created and laid out.
+        """
+        if self._sections_built:
+            return
+        self._sections_built = True
+
+        # Suspend repaints so the sections are laid out in a single pass
+        content_widget = self._content_layout.parentWidget()
+        content_widget.setUpdatesEnabled(False)
+
+        self._content_layout.removeWidget(self._placeholder)
+        self._placeholder.deleteLater()
+
         # Add organized menu explanations
-        self.add_menu_section(content_layout, "Signal Visualizer Menu", [
+        self.add_menu_section(self._content_layout, "Signal Visualizer Menu", [
             "Info: View information about the application",
             "Exit: Close the program"
         ])
         
         # Generate menu section with introductory text
-        self.add_menu_section(content_layout, "Generate Menu", [
+        self.add_menu_section(self._content_layout, "Generate Menu", [
             "Pure tone: Generate a single frequency tone",
             "Free addition of pure tones: Combine multiple tones",
             "Noise: Generate different types of noise signals",
@@ -121,36 +205,22 @@ class FirstRunDialog(QDialog):
         intro_text="The Generate menu contains tools for creating various types of audio signals. ")
 
         # Input menu section
-        self.add_menu_section(content_layout, "Input Menu", [
+        self.add_menu_section(self._content_layout, "Input Menu", [
             "Load: Load audio files from your computer",
             "Record: Record audio from your microphone"
         ])
         
         # Tuner menu section
-        self.add_menu_section(content_layout, "Tuner Menu", [
+        self.add_menu_section(self._content_layout, "Tuner Menu", [
             "Live STFT: Real-time audio frequency analysis"
         ])
         
         # Examples menu section
-        self.add_menu_section(content_layout, "Examples Menu", [
+        self.add_menu_section(self._content_layout, "Examples Menu", [
             "Cretan Lute: Example of some recordings i made to analyse what i found interesting concepts"
         ])
 
-        # Set size policy to ensure proper scrolling behavior
-        content_widget.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
-        content_widget.setMinimumSize(500, 400)  # Minimum size to ensure scroll appears
-
-        scroll.setWidget(content_widget)
-        main_layout.addWidget(scroll)
-
-        # Bottom controls section
-        self.dont_show_checkbox = QCheckBox("Don't show this again")
-        main_layout.addWidget(self.dont_show_checkbox)
-
-        # Action button
-        close_button = QPushButton("Get Started")
-        close_button.clicked.connect(self.accept)  # Close dialog on click
-        main_layout.addWidget(close_button)
+        content_widget.setUpdatesEnabled(True)
     
     def add_menu_section(self, layout, title, items, intro_text=None):
         """
@@ -175,11 +245,12 @@ class FirstRunDialog(QDialog):
             intro_label.setStyleSheet("font-style: italic; margin-bottom: 10px;")
             group_layout.addWidget(intro_label)
         
-        # Add each menu item as a bullet point
-        for item in items:
-            label = QLabel(f"• {item}")
-            label.setWordWrap(True)  # Ensure long text wraps properly
-            group_layout.addWidget(label)
+        # All items go in one rich-text label as a bullet list
+        html = '<ul>' + ''.join(f'<li>{escape(item)}</li>' for item in items) + '</ul>'
+        items_label = QLabel(html)
+        items_label.setTextFormat(Qt.RichText)
+        items_label.setWordWrap(True)  # Ensure long text wraps properly
+        group_layout.addWidget(items_label)
         
         group.setLayout(group_layout)
         layout.addWidget(group)
\ No newline at end of file
@@ -0,0 +1,11 @@
+"""
+Welcome Dialog Settings
+
+QSettings location and key of the welcome dialog's "Don't show this again"
+preference. Kept separate from popupinfo so the main window can check the
+preference without importing the dialog module.
+"""
+
+SETTINGS_ORG = "SignalVisualizer"
+SETTINGS_APP = "SignalVisualizer"
+DONT_SHOW_KEY = "dont_show_welcome"
@@ -17,7 +17,9 @@ Key Features:
 Dependencies:
 - numpy: Numerical computations and FFT processing
 - pyaudio: Audio input stream handling
-- scipy.fft: Fast Fourier Transform computations
+- scipy.fft: Real-input Fast Fourier Transform computations
+- numba: Optional JIT compilation of the spectrum dB conversion
+- pyfftw: Optional faster FFT backend with plan caching
 - matplotlib: Real-time plotting and visualization
 - PyQt5: Graphical user interface components
 
@@ -26,9 +28,13 @@ Date: 25/9/2025
 Version: 1.0
 """
 
+import math
+from collections import deque
+from functools import lru_cache
+
 import numpy as np
 import pyaudio
-from scipy.fft import fft
+from scipy.fft import rfft, next_fast_len
 from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
 from matplotlib.figure import Figure
 from PyQt5.QtWidgets import (QMessageBox, QPushButton, QCheckBox, QWidget, QSlider, QVBoxLayout, QComboBox, QLabel, 
@@ -37,6 +43,67 @@ from PyQt5.QtCore import QTimer, Qt
 import matplotlib.pyplot as plt
 from matplotlib.backends.backend_qt5agg import NavigationToolbar2QT as NavigationToolbar
 
+# Scale from 16-bit PCM to [-1, 1), kept as float32 so samples never widen to float64
+INT16_SCALE = np.float32(1.0 / 32768.0)
+
+# Plot refresh interval while the visualizer is on screen (ms)
+UPDATE_INTERVAL_MS = 20
+
+# pyFFTW, when installed, is faster for the same-size transform repeated every
+# frame; its plan cache keeps the FFTW plan alive between frames. Only this
+# module's rfft is switched, scipy's global backend is left alone.
+try:
+    import pyfftw
+    import pyfftw.interfaces.scipy_fft
+    pyfftw.interfaces.cache.enable()
+    pyfftw.interfaces.cache.set_keepalive_time(60)
+    rfft = pyfftw.interfaces.scipy_fft.rfft
+    PYFFTW_AVAILABLE = True
+except ImportError:
+    PYFFTW_AVAILABLE = False
+
+# Numba is optional here: make_spectrum_processor returns None without it
+# and the tuner converts each frame to dB with plain NumPy
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+
+@lru_cache(maxsize=None)
+def make_spectrum_processor(n_bins, floor, scale):
+    """
+    Build a dB conversion routine specialized for one spectrum size.
+    
+    The bin count, power floor and dB scale are captured by the closure,
+    so Numba compiles them in as constants. Results are cached, so each
+    (CHUNK, RATE) configuration is compiled only once per process.
+    
+    Args:
+        n_bins: Number of rfft bins (FFT_N // 2 + 1)
+        floor: Power floor added before the logarithm
+        scale: Constant dB term (amplitude scaling of the spectrum)
+        
+    Returns:
+        callable or None: process(re, im, out) computing
+        out = 10*log10(re^2 + im^2 + floor) + scale in one pass,
+        or None when Numba is not available
+    """
+    if not NUMBA_AVAILABLE:
+        return None
+
+    def process(re, im, out):
+        for i in range(n_bins):
+            out[i] = 10.0 * math.log10(re[i] * re[i] + im[i] * im[i] + floor) + scale
+
+    process = njit(fastmath=True)(process)
+    # Compile now for the strided float32 views of a complex64 rfft result,
+    # so the first live frame does not pay the JIT cost
+    warmup = np.zeros(n_bins, dtype=np.complex64)
+    process(warmup.real, warmup.imag, np.empty(n_bins, dtype=np.float32))
+    return process
+
 class AudioFFTVisualizer(QWidget):
     """
     Real-time audio FFT visualizer with instrument tuning assistance.
@@ -55,6 +122,7 @@ class AudioFFTVisualizer(QWidget):
     Attributes:
         controller: Reference to main application controller
         CHUNK: Samples per buffer for audio processing
+        FFT_N: FFT length, CHUNK rounded up to a fast transform size
         FORMAT: Audio format (16-bit integer)
         CHANNELS: Number of audio channels (mono)
         RATE: Sample rate in Hz (44.1 kHz)
@@ -96,6 +164,30 @@ class AudioFFTVisualizer(QWidget):
         self.CHANNELS = 1  # Mono audio input
         self.RATE = 44100  # Sample rate (Hz) - CD quality
         self.frequency_range = (20, 20000)  # Human hearing range (20Hz-20kHz)
+
+        # Transform length: the smallest size >= CHUNK that the FFT handles
+        # efficiently. Equal to CHUNK for powers of two; if CHUNK is changed to
+        # an awkward length the frame is zero-padded up to this size instead.
+        self.FFT_N = next_fast_len(self.CHUNK, real=True)
+
+        # CHUNK and RATE are fixed, so the analysis window and the FFT bin
+        # frequencies are computed once instead of on every frame
+        # float32 and C-contiguous like the audio buffers, so the per-frame
+        # window multiply runs NumPy's SIMD same-dtype loop
+        self._window = np.ascontiguousarray(np.hanning(self.CHUNK), dtype=np.float32)
+        self._freqs = np.fft.rfftfreq(self.FFT_N, 1 / self.RATE).astype(np.float32)
+
+        # dB conversion works on the power spectrum (no sqrt): the 2/CHUNK
+        # amplitude scaling becomes a constant dB term, and the floor keeps the
+        # same -160 dB minimum as an amplitude floor of 1e-8
+        self._db_scale = np.float32(20 * np.log10(2.0 / self.CHUNK))
+        self._psd_floor = np.float32((1e-8 * self.CHUNK / 2.0) ** 2)
+
+        # Single-pass dB conversion compiled for this transform size
+        # (None without Numba, in which case the NumPy path is used)
+        self._process = make_spectrum_processor(self.FFT_N // 2 + 1,
+                                                float(self._psd_floor),
+                                                float(self._db_scale))
         
         # Initialize PyAudio and get available input devices
         try:
@@ -146,18 +238,37 @@ class AudioFFTVisualizer(QWidget):
         # Setup matplotlib figure and canvas
         self.setup_ui()
 
+        # Data buffers for audio processing. Created before the stream starts
+        # so the callback never runs against missing or float64 buffers.
+        # Single precision throughout: scipy.fft runs its float32 kernels
+        self.audio_data = np.zeros(self.CHUNK, dtype=np.float32)
+        self.fft_data = np.zeros(self.FFT_N // 2 + 1, dtype=np.float32)  # rfft bin count
+
+        # Blocks delivered by the audio callback and not yet drawn. Bounded so
+        # a stalled GUI never holds more than a few stale blocks.
+        self._pending = deque(maxlen=4)
+        # Spectrum of the newest block (dB, before the offset) and the zoom it
+        # was computed at; reused until a new block arrives or the gain moves
+        self._spectrum_zoom = None
+        self._last_input_rms = -1.0  # RMS of the last transformed block
+
+        # Per-frame work buffers, filled in place with out= so update_plot
+        # does not allocate new arrays on every tick
+        n_bins = self.FFT_N // 2 + 1
+        self._processed = np.empty(self.CHUNK, dtype=np.float32)
+        self._windowed = np.empty(self.CHUNK, dtype=np.float32)
+        self._psd = np.empty(n_bins, dtype=np.float32)
+        self._spectrum_db = np.empty(n_bins, dtype=np.float32)
+        self._mag_db = np.empty(n_bins, dtype=np.float32)
+        self.running = True  # Control flag for the visualization loop
+
         # Start audio stream with default device
         self.start_audio_stream()
         
-        # Data buffers for audio processing
-        self.audio_data = np.zeros(self.CHUNK)
-        self.fft_data = np.zeros(self.CHUNK//2)
-        self.running = True  # Control flag for the visualization loop
-        
         # Timer for periodic plot updates (50 FPS)
         self.timer = QTimer(self)
         self.timer.timeout.connect(self.update_plot)
-        self.timer.start(20)  # Update every 20ms
+        self.timer.start(UPDATE_INTERVAL_MS)  # Update every 20ms
 
     def show_no_microphone_warning(self):
         """
@@ -291,7 +402,7 @@ class AudioFFTVisualizer(QWidget):
         # Log/linear frequency scale checkbox
         self.log_freq_checkbox = QCheckBox("Linear Frequency")
         self.log_freq_checkbox.setChecked(False)  # Default to log scale
-        self.log_freq_checkbox.stateChanged.connect(self.update_plot)
+        self.log_freq_checkbox.stateChanged.connect(self.request_full_redraw)
         
         # Add widgets to control panel
         control_layout.addWidget(self.device_label)
@@ -386,30 +497,43 @@ class AudioFFTVisualizer(QWidget):
         """
         Update the frequency reference lines based on selected instrument.
         
-        Clears existing frequency markers and creates new vertical lines
-        and labels at the fundamental frequencies of the selected instrument.
+        Moves the pre-created vertical lines and labels to the fundamental
+        frequencies of the selected instrument and hides the unused ones.
         This helps users identify and tune to specific instrument notes.
         
         Args:
             instrument_name: Name of the selected instrument, or None to clear markers
         """
-        # Clear existing markers and labels
-        for marker in self.freq_markers:
-            marker.remove()
-        for label in self.freq_labels:
-            label.remove()
-        self.freq_markers.clear()
-        self.freq_labels.clear()
-
-        # Skip if no instrument selected or it's the placeholder
+        # No markers if no instrument selected or it's the placeholder
         if not instrument_name or instrument_name == "-- Select Instrument --":
-            self.canvas.draw()
-            return
+            frequencies, labels = [], []
+        else:
+            # Get frequencies and labels for selected instrument
+            frequencies = self.instrument_frequencies.get(instrument_name, [])
+            labels = self.instrument_labels.get(instrument_name, [])
+
+        # Move the pre-created markers into place and hide the unused ones
+        for i, (marker, text) in enumerate(zip(self.freq_markers, self.freq_labels)):
+            if i < min(len(frequencies), len(labels)):
+                freq = frequencies[i]
+                marker.set_xdata([freq, freq])
+                text.set_x(freq)
+                text.set_text(f"{labels[i]} ({freq:.1f}Hz)")
+                marker.set_visible(True)
+                text.set_visible(True)
+            else:
+                marker.set_visible(False)
+                text.set_visible(False)
 
-        # Get frequencies and labels for selected instrument
-        frequencies = self.instrument_frequencies.get(instrument_name, [])
-        labels = self.instrument_labels.get(instrument_name, [])
+        self.canvas.draw()
 
+    def create_instrument_markers(self):
+        """
+        Create the reference lines and labels used for instrument notes.
+        
+        One hidden line/label pair is created per marker color; the
+        instrument dropdown only moves, relabels and shows them.
+        """
         # Create vertical lines and labels for each frequency
         colors = [
                 '#FF5733',  # Red-orange
@@ -421,20 +545,20 @@ class AudioFFTVisualizer(QWidget):
         ]
         
         # Calculate dynamic vertical positions (higher on the plot)
-        num_notes = len(frequencies)
         base_y = 25  # Starting y position (higher up)
         y_step = 20   # Vertical spacing between labels
-        y_positions = [base_y - (i % 3) * y_step for i in range(num_notes)]
         angle = 30  # Rotation angle for labels
         
-        for freq, label, color, y_pos in zip(frequencies, labels, colors, y_positions):
-            # Add vertical line at instrument frequency
-            marker = self.ax_fft.axvline(x=freq, color=color, linestyle='--', alpha=0.7, linewidth=1.5)
+        for i, color in enumerate(colors):
+            y_pos = base_y - (i % 3) * y_step
+            # Vertical line at the instrument frequency
+            marker = self.ax_fft.axvline(x=self.frequency_range[0], color=color, linestyle='--',
+                                         alpha=0.7, linewidth=1.5, visible=False)
             self.freq_markers.append(marker)
             
-            # Add text label without box for better visibility
+            # Text label without box for better visibility
             text = self.ax_fft.text(
-                freq, y_pos, f"{label} ({freq:.1f}Hz)", 
+                self.frequency_range[0], y_pos, "", 
                 color=color, 
                 ha='center', 
                 va='top',
@@ -442,16 +566,11 @@ class AudioFFTVisualizer(QWidget):
                 alpha=0.9,
                 weight='bold',
                 rotation=angle,
-                rotation_mode='anchor'
+                rotation_mode='anchor',
+                visible=False
             )
             self.freq_labels.append(text)
 
-        # Adjust ylim to ensure labels are visible
-        current_ylim = self.ax_fft.get_ylim()
-        self.ax_fft.set_ylim(current_ylim[0], current_ylim[1])  # Keep existing upper limit
-        
-        self.canvas.draw()
-
     def populate_device_dropdown(self):
         """
         Populate the dropdown with available audio input devices.
@@ -491,7 +610,8 @@ class AudioFFTVisualizer(QWidget):
         
         # Waveform plot initialization
         self.x_wave = np.arange(0, self.CHUNK)
-        self.line_wave, = self.ax_wave.plot(self.x_wave, np.zeros(self.CHUNK), 'b')
+        # Lines are animated: drawn by blitting, not as part of the full figure
+        self.line_wave, = self.ax_wave.plot(self.x_wave, np.zeros(self.CHUNK), 'b', animated=True)
         self.ax_wave.set_title('Time Domain - Microphone Input')
         self.ax_wave.set_xlim(0, self.CHUNK)
         self.ax_wave.set_ylim(-1, 1)  # Normalized amplitude range
@@ -499,8 +619,7 @@ class AudioFFTVisualizer(QWidget):
         self.ax_wave.grid(True)
         
         # FFT plot initialization with log frequency scale
-        freqs = np.fft.rfftfreq(self.CHUNK, 1 / self.RATE)
-        self.line_fft, = self.ax_fft.semilogx(freqs, np.zeros_like(freqs), 'r')
+        self.line_fft, = self.ax_fft.semilogx(self._freqs, np.zeros_like(self._freqs), 'r', animated=True)
         
         # Changing the coordinate format
         def format_time_amp(x, y):
@@ -517,6 +636,7 @@ class AudioFFTVisualizer(QWidget):
 
         # Setup custom log-scale frequency ticks
         self.setup_log_ticks()
+        self._scale_mode = 'log'  # Current frequency axis scale
 
         self.ax_fft.set_title('Frequency Domain - FFT Analysis')
         self.ax_fft.set_xlim(*self.frequency_range)  # Human hearing range
@@ -525,6 +645,22 @@ class AudioFFTVisualizer(QWidget):
         self.ax_fft.set_ylabel('Magnitude (dB)')
         self.ax_fft.grid(True, which='both')  # Major and minor grid lines
 
+        # Log-scale display decimation: start bins of ~1200 log-spaced groups
+        # across the visible range, about one per horizontal pixel
+        group_starts = np.searchsorted(self._freqs, np.logspace(
+            np.log10(self.frequency_range[0]), np.log10(self.frequency_range[1]), 1200))
+        self._fft_decim_idx = np.unique(group_starts)
+        self._fft_decim_freqs = self._freqs[self._fft_decim_idx]
+
+        # Instrument reference markers, hidden until an instrument is chosen
+        self.create_instrument_markers()
+
+        # Blitting state: backgrounds are captured after each full draw
+        self._bg_wave = None
+        self._bg_fft = None
+        self._full_redraw = True
+        self.canvas.mpl_connect('draw_event', self.on_canvas_draw)
+
     def update_zoom_level(self, value):
         """
         Update the zoom/gain level for the FFT plot.
@@ -537,8 +673,7 @@ class AudioFFTVisualizer(QWidget):
             value: New zoom level (10-120, where 60 is neutral)
         """
         self.zoom_level = value
-        self.ax_fft.set_ylim(-self.zoom_level, 0)
-        self.canvas.draw()
+        self.request_full_redraw()
 
     def change_device(self, index):
         """
@@ -570,7 +705,9 @@ class AudioFFTVisualizer(QWidget):
         """
         if self.running:
             # Convert 16-bit integer data to normalized float (-1 to 1)
-            self.audio_data = np.frombuffer(in_data, dtype=np.int16) / 32768.0
+            # Cast and scale in one ufunc pass, without an intermediate float array
+            raw = np.frombuffer(in_data, dtype=np.int16)
+            self._pending.append(np.multiply(raw, INT16_SCALE, dtype=np.float32))
         return (in_data, pyaudio.paContinue)
 
     def setup_log_ticks(self):
@@ -655,10 +792,13 @@ class AudioFFTVisualizer(QWidget):
         - Both plots update in real-time
         """
         if self.freeze_button.isChecked():
-            # Freeze the current audio and FFT data
-            self.freeze_audio_data = self.audio_data.copy()
-            self.freeze_fft_data = self.fft_data.copy()
-            self.freeze_freqs = np.fft.rfftfreq(self.CHUNK, 1 / self.RATE)
+            # Hold references to the current audio and FFT data. No copy is
+            # needed: each audio block is a fresh array the callback never
+            # touches again, and the dB buffer is only rewritten by the live
+            # branch of update_plot, which does not run while frozen.
+            self.freeze_audio_data = self.audio_data
+            self.freeze_fft_data = self.fft_data
+            self.freeze_freqs = self._freqs
             self.freeze_button.setText("Unfreeze Display")
             print("Display frozen - holding current waveform and spectrum")
         else:
@@ -670,7 +810,7 @@ class AudioFFTVisualizer(QWidget):
             print("Display unfrozen - showing live data")
         
         # Update the plot to reflect freeze state
-        self.update_plot()
+        self.request_full_redraw()
 
     def update_plot(self):
         """
@@ -678,53 +818,109 @@ class AudioFFTVisualizer(QWidget):
         
         Modified to handle frozen state for both waveform and FFT.
         """
-        if not self.running or not hasattr(self, 'audio_data'):
+        if not self.running or not hasattr(self, 'audio_data') or not self.isVisible():
             return
 
         # Check if display is frozen
         if self.freeze_button.isChecked() and hasattr(self, 'freeze_audio_data'):
             # Use frozen data for both plots
-            processed_audio = self.freeze_audio_data * (self.zoom_level / 60.0)
+            processed_audio = np.multiply(self.freeze_audio_data, np.float32(self.zoom_level / 60.0),
+                                          out=self._processed)
             mag_db = self.freeze_fft_data
             freqs = self.freeze_freqs
         else:
+            # Take the newest queued block; older ones are already out of date
+            block = None
+            while self._pending:
+                block = self._pending.popleft()
+            if block is not None:
+                self.audio_data = block
+
             # Use live data with current processing
-            zoom_factor = self.zoom_level / 60.0
-            processed_audio = self.audio_data * zoom_factor
+            zoom_factor = np.float32(self.zoom_level / 60.0)
+            processed_audio = np.multiply(self.audio_data, zoom_factor, out=self._processed)
             
-            # Compute live FFT
-            window = np.hanning(len(processed_audio))
-            yf = fft(processed_audio * window)
-            mag_lin = 2 / self.CHUNK * np.abs(yf[:len(yf)//2 + 1])
-            mag_db = 20 * np.log10(mag_lin + 1e-8) + self.offset_slider.value()
-            freqs = np.fft.rfftfreq(self.CHUNK, 1 / self.RATE)
+            # A block lasts CHUNK/RATE (~190 ms), several timer ticks, so the
+            # FFT only runs when the input or the gain actually changed
+            recompute = self._spectrum_zoom != self.zoom_level
+            if block is not None or recompute:
+                # A new block whose RMS matches the last transformed one
+                # (silence, a held steady tone) reuses the previous spectrum
+                rms = math.sqrt(np.dot(processed_audio, processed_audio) / self.CHUNK)
+                recompute = recompute or abs(rms - self._last_input_rms) >= 1e-4 * max(rms, 1e-6)
+            if recompute:
+                # Real input, so only the non-negative frequency half is computed
+                # workers=-1 lets the FFT use every available core
+                np.multiply(processed_audio, self._window, out=self._windowed)
+                yf = rfft(self._windowed, n=self.FFT_N, workers=-1)
+                if self._process is not None:
+                    self._process(yf.real, yf.imag, self._spectrum_db)
+                else:
+                    # |yf|^2 into _psd, using _spectrum_db as scratch for imag^2
+                    np.multiply(yf.real, yf.real, out=self._psd)
+                    np.multiply(yf.imag, yf.imag, out=self._spectrum_db)
+                    self._psd += self._spectrum_db
+                    self._psd += self._psd_floor
+                    np.log10(self._psd, out=self._spectrum_db)
+                    self._spectrum_db *= 10
+                    self._spectrum_db += self._db_scale
+                self._spectrum_zoom = self.zoom_level
+                self._last_input_rms = rms
+            mag_db = np.add(self._spectrum_db, self.offset_slider.value(), out=self._mag_db)
+            freqs = self._freqs
             
-            # Store current data for potential freezing
-            self.fft_data = mag_db.copy()
+            # Keep a reference for potential freezing
+            self.fft_data = mag_db
 
         # Update waveform plot
         self.line_wave.set_ydata(processed_audio)
-        self.ax_wave.set_ylim(-1, 1)
 
         # Update FFT line data
-        min_length = min(len(freqs), len(mag_db))
-        self.line_fft.set_data(freqs[:min_length], mag_db[:min_length])
-
-        # Handle frequency scale type (logarithmic or linear)
+        # freqs and mag_db both hold FFT_N // 2 + 1 bins by construction
         if self.log_freq_checkbox.isChecked():
-            self.ax_fft.set_xscale("linear")
-            self.ax_fft.set_xlim(0, self.RATE / 2)
-            self.ax_fft.xaxis.set_major_formatter(plt.ScalarFormatter())
-            self.ax_fft.xaxis.set_major_locator(plt.MaxNLocator(10))
+            self.line_fft.set_data(freqs, mag_db)
+        else:
+            # Log scale: one point per log-spaced group of bins, keeping each
+            # group's peak so narrow high-frequency partials are not lost
+            self.line_fft.set_data(self._fft_decim_freqs,
+                                   np.maximum.reduceat(mag_db, self._fft_decim_idx))
+
+        if self._full_redraw or self._bg_wave is None:
+            self._full_redraw = False
+            self.apply_plot_layout()
+            self.canvas.draw()  # Backgrounds are recaptured in on_canvas_draw
         else:
-            self.ax_fft.set_xscale("log")
-            self.ax_fft.set_xlim(*self.frequency_range)
-            self.setup_log_ticks()
-                        
-        # Remove any zero lines (including red line artifacts)
-        for line in self.ax_fft.lines:
-            if len(line.get_ydata()) > 0 and np.all(line.get_ydata() == 0):
-                line.remove()
+            # Only the two lines changed: repaint them over the cached backgrounds
+            for ax, line, background in ((self.ax_wave, self.line_wave, self._bg_wave),
+                                         (self.ax_fft, self.line_fft, self._bg_fft)):
+                self.canvas.restore_region(background)
+                ax.draw_artist(line)
+                self.canvas.blit(ax.bbox)
+
+    def apply_plot_layout(self):
+        """
+        Apply axis scales, limits and titles for the current control state.
+        
+        Only needed when the frequency scale, freeze state or gain changes;
+        the per-frame update blits the lines without touching the axes.
+        """
+        self.ax_wave.set_ylim(-1, 1)
+
+        # Handle frequency scale type (logarithmic or linear). The ticks and
+        # tight_layout in setup_log_ticks are costly, so only redo them when
+        # the scale actually switches.
+        scale_mode = 'linear' if self.log_freq_checkbox.isChecked() else 'log'
+        if scale_mode != self._scale_mode:
+            if scale_mode == 'linear':
+                self.ax_fft.set_xscale("linear")
+                self.ax_fft.set_xlim(0, self.RATE / 2)
+                self.ax_fft.xaxis.set_major_formatter(plt.ScalarFormatter())
+                self.ax_fft.xaxis.set_major_locator(plt.MaxNLocator(10))
+            else:
+                self.ax_fft.set_xscale("log")
+                self.ax_fft.set_xlim(*self.frequency_range)
+                self.setup_log_ticks()
+            self._scale_mode = scale_mode
 
         # Adjust y-limits based on current offset settings
         max_offset = self.offset_slider.maximum()
@@ -738,8 +934,55 @@ class AudioFFTVisualizer(QWidget):
             self.ax_wave.set_title('Time Domain - Microphone Input')
             self.ax_fft.set_title('Frequency Domain - FFT Analysis')
 
-        self.canvas.draw()
-    
+    def request_full_redraw(self, *args):
+        """
+        Redraw the whole figure on the next update instead of blitting.
+        
+        Connected to controls that change axes, ticks or titles.
+        """
+        self._full_redraw = True
+        self.update_plot()
+
+    def on_canvas_draw(self, event):
+        """
+        Cache the axes backgrounds after every full canvas draw.
+        
+        The lines are animated artists, so they are left out of the full
+        draw and painted on top here; later frames restore the cached
+        backgrounds and repaint only the lines.
+        
+        Args:
+            event: Matplotlib DrawEvent
+        """
+        self._bg_wave = self.canvas.copy_from_bbox(self.ax_wave.bbox)
+        self._bg_fft = self.canvas.copy_from_bbox(self.ax_fft.bbox)
+        self.ax_wave.draw_artist(self.line_wave)
+        self.ax_fft.draw_artist(self.line_fft)
+
+    def showEvent(self, event):
+        """
+        Resume plot updates when the visualizer becomes visible.
+        
+        Args:
+            event: QShowEvent object
+        """
+        super().showEvent(event)
+        if hasattr(self, 'timer') and self.running and not self.timer.isActive():
+            self.timer.start(UPDATE_INTERVAL_MS)
+
+    def hideEvent(self, event):
+        """
+        Stop plot updates while the visualizer is hidden.
+        
+        The audio stream keeps running; only the drawing pauses, so an
+        off-screen tuner page costs no plotting time.
+        
+        Args:
+            event: QHideEvent object
+        """
+        super().hideEvent(event)
+        if hasattr(self, 'timer'):
+            self.timer.stop()
 
     def closeEvent(self, event):
         """
@@ -19,7 +19,9 @@ Dependencies:
 - librosa: Audio analysis and feature extraction
 - matplotlib: Multi-panel visualization and plotting
 - PyQt5: Graphical user interface components
-- scipy: Signal processing and peak detection
+- scipy: Signal processing (FFT, windows, filtering)
+- numba: Optional JIT compilation of the playback spectrum dB conversion
+- cupy: Optional GPU computation of the playback spectrum
 - PyQt5.QtMultimedia: Audio playback functionality
 
 Author: Matteo Tsikalakis-Reeder
@@ -29,27 +31,123 @@ Version: 1.0
 
 import numpy as np
 import librosa
-import librosa.display
 import os
 import time
 import matplotlib.pyplot as plt
 from PyQt5.QtMultimedia import QMediaPlayer, QMediaContent
-from PyQt5.QtCore import QUrl, Qt
+from PyQt5.QtCore import QUrl, Qt, QTimer
 from PyQt5.QtWidgets import ( QTextBrowser, QComboBox, QCheckBox, QWidget, QVBoxLayout, QLabel, QScrollArea, 
                             QGroupBox, QPushButton, QMessageBox, 
                             QFormLayout, QSpinBox, QHBoxLayout,
                             QSizePolicy, QApplication)
 from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas, NavigationToolbar2QT
 from matplotlib.figure import Figure
-from scipy.signal import find_peaks
+from scipy.fft import rfft, next_fast_len
+from scipy.ndimage import uniform_filter1d
 from scipy.signal.windows import blackmanharris 
 
 from PyQt5.QtWebEngineWidgets import QWebEngineView
 from PyQt5.QtCore import QUrl
+import math
 import os
 import sys
+import tempfile
 from pathlib import Path
 
+# Decoded audio larger than this is kept in a memory-mapped temporary file
+# instead of RAM (about 6 minutes of 44.1kHz float32 mono)
+MMAP_THRESHOLD_BYTES = 64 * 1024 * 1024
+
+# Sorted WAV names per directory, with the directory mtime they were listed at
+_wav_list_cache = {}
+
+
+def _list_wav_files(directory):
+    """
+    Sorted WAV file names in a directory, relisted only when it changes.
+    
+    Adding, removing or renaming a file updates the directory's mtime, so
+    a new visualizer window reuses the previous listing until then.
+    """
+    mtime = os.stat(directory).st_mtime_ns
+    cached = _wav_list_cache.get(directory)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+    with os.scandir(directory) as entries:
+        files = sorted(e.name for e in entries
+                       if e.name.lower().endswith(".wav") and e.is_file())
+    _wav_list_cache[directory] = (mtime, files)
+    return files
+
+
+# Numba is installed alongside librosa; fall back to plain NumPy without it
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+
+def _spectrum_to_db(re, im, out):
+    """
+    Peak-normalized dB spectrum in [-60, 0] from real/imaginary FFT parts.
+    
+    Fuses magnitude, dB conversion, max search, normalization and clipping
+    into two passes over the bins with no temporary arrays. Only used when
+    Numba is available.
+    """
+    peak = -np.inf
+    for i in range(out.shape[0]):
+        # 10*log10(|X|^2) == 20*log10(|X|); 1e-16 matches the 1e-8 amplitude floor
+        value = 10.0 * math.log10(re[i] * re[i] + im[i] * im[i] + 1e-16)
+        out[i] = value
+        if value > peak:
+            peak = value
+    for i in range(out.shape[0]):
+        value = out[i] - peak
+        out[i] = -60.0 if value < -60.0 else value
+
+
+def _stft_to_db(D, out):
+    """
+    Unnormalized dB values of a complex STFT block, written into `out`.
+    
+    Same result as librosa.amplitude_to_db(np.abs(D), ref=1.0, top_db=None)
+    but from the squared magnitude, so there is no square root and no
+    intermediate magnitude array. Rows are processed in parallel when
+    Numba is available.
+    """
+    for i in prange(D.shape[0]):
+        for j in range(D.shape[1]):
+            value = D[i, j]
+            power = value.real * value.real + value.imag * value.imag
+            # 1e-10 power floor == librosa's 1e-5 amplitude floor
+            out[i, j] = 10.0 * math.log10(power if power > 1e-10 else 1e-10)
+
+
+if NUMBA_AVAILABLE:
+    # The on-disk cache needs the source file, which a frozen bundle lacks
+    _spectrum_to_db = njit(fastmath=True, cache=not getattr(sys, 'frozen', False))(_spectrum_to_db)
+    _stft_to_db = njit(parallel=True, fastmath=True,
+                       cache=not getattr(sys, 'frozen', False))(_stft_to_db)
+
+
+# Optional GPU path for the playback FFT. CuPy can import fine on machines
+# without a usable CUDA device, so the device count is checked as well.
+try:
+    import cupy as cp
+    import cupyx.scipy.fft as cufft
+    CUPY_AVAILABLE = cp.cuda.runtime.getDeviceCount() > 0
+except Exception:
+    CUPY_AVAILABLE = False
+
+if CUPY_AVAILABLE:
+    @cp.fuse()
+    def _gpu_spectrum_db(spectrum):
+        """Unnormalized dB magnitude of a complex spectrum, fused into one GPU kernel."""
+        return 20.0 * cp.log10(cp.maximum(cp.abs(spectrum), 1e-8))
+
+
 class BeatFrequencyVisualizer(QWidget):
     """
     Advanced audio analysis tool for visualizing beat frequencies and acoustic phenomena.
@@ -69,11 +167,13 @@ class BeatFrequencyVisualizer(QWidget):
         audio_data: Loaded audio signal as numpy array
         sample_rate: Audio sample rate in Hz
         time: Time array corresponding to audio_data
+        freqs: FFT bin frequencies for fft_size at sample_rate
         playback_lines: List of vertical cursor lines for playback indication
         axes: List of references to all matplotlib axes
-        backgrounds: Cached background for blitting optimization
+        backgrounds: Cached per-axes backgrounds for blitting optimization
         last_update_time: Timestamp for frame rate control
-        update_interval: Minimum time between plot updates (seconds)
+        update_interval: Minimum time between cursor updates (seconds)
+        fft_timer: Timer driving the real-time FFT panel during playback
         first_playback: Flag indicating first playback after file load
         fft_size: Size of FFT for frequency analysis (affects resolution)
         peak_markers: Plot object for FFT peak indicators
@@ -96,19 +196,31 @@ class BeatFrequencyVisualizer(QWidget):
         super().__init__(parent)
         self.controller = controller
         self.audio_data = None  # Will store loaded audio signal
+        self._mmap_path = None  # Temporary file backing audio_data for long recordings
         self.sample_rate = None  # Will store audio sample rate
-        self.time = None  # Will store time array for audio data
+        self.freqs = None  # Will store FFT bin frequencies for the loaded file
         self.playback_lines = []  # Store playback cursor lines for all plots
         self.axes = []  # Store references to all axes for coordinated updates
-        self.backgrounds = None  # Will store the complete figure background for blitting
-        self.last_update_time = time.time()  # For frame rate control
-        self.update_interval = 0.02  # 20ms for ~50fps smooth updates
+        self.backgrounds = {}  # Will store the background of each axes for blitting
+        self.last_update_time = time.monotonic()  # For frame rate control
+        # Just under the 20ms notify interval so timer jitter does not drop
+        # every other update, while piled-up notifications are skipped
+        self.update_interval = 0.015
 
         self.first_playback = True  # Flag to handle initial playback setup
 
         # FFT parameters for high-resolution frequency analysis
-        self.fft_size = 4096 * 4  # 32768-point FFT for high frequency resolution
+        # 16384-point FFT for high frequency resolution, rounded to a fast size
+        self.fft_size = next_fast_len(4096 * 4, real=True)
         self.peak_markers = None  # Will be initialized in plot_spectrogram for peak indicators
+        self._window_cache = {}  # Blackman-Harris windows keyed by frame size
+        # Zero-padded float32 FFT input; the first _fft_in_len samples hold the frame
+        self._fft_in = np.zeros(self.fft_size, dtype=np.float32)
+        self._fft_in_len = 0
+        # Normalized dB spectrum written in place each tick
+        self._db_buf = np.empty(self.fft_size // 2 + 1, dtype=np.float32)
+        # Magnitude scratch buffer for the NumPy fallback
+        self._mag_buf = np.empty(self.fft_size // 2 + 1, dtype=np.float32)
                 
         # Set up recordings directory path - inside library/recordings
         self.recordings_dir = self.get_recordings_directory()
@@ -125,6 +237,12 @@ class BeatFrequencyVisualizer(QWidget):
         self.media_player = QMediaPlayer()
         self.media_player.setNotifyInterval(20)  # 20ms update interval for smooth cursor
         self.media_player.positionChanged.connect(self.update_playback_cursor)
+        self.media_player.stateChanged.connect(self._on_player_state_changed)
+
+        # The real-time FFT runs at its own 25Hz cadence, separate from the cursor
+        self.fft_timer = QTimer(self)
+        self.fft_timer.setInterval(40)
+        self.fft_timer.timeout.connect(self.update_fft)
         
         self.init_ui()  # Initialize user interface
         self.load_audio_files_list()  # Load available audio files into dropdown
@@ -174,6 +292,8 @@ class BeatFrequencyVisualizer(QWidget):
         self.max_freq_spin = QSpinBox()
         self.max_freq_spin.setRange(100, 10000)  # Frequency range limit for spectrogram
         self.max_freq_spin.setValue(2000)  # Default maximum frequency
+        # Only the spectrogram's y-limit depends on it, so no replot is needed
+        self.max_freq_spin.valueChanged.connect(self._update_freq_ylim)
         
         self.window_size_spin = QSpinBox()
         self.window_size_spin.setRange(256, 4096)  # FFT window size range
@@ -241,6 +361,8 @@ class BeatFrequencyVisualizer(QWidget):
         self.canvas = FigureCanvas(self.figure)
         self.canvas.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
         self.toolbar = NavigationToolbar2QT(self.canvas, self)  # Plot navigation
+        # Every full draw (replot, resize, toolbar pan/zoom) refreshes the blit backgrounds
+        self.canvas.mpl_connect('draw_event', self._on_canvas_draw)
         
         # Add all widgets to main layout
         main_layout.addWidget(control_panel)
@@ -305,44 +427,48 @@ class BeatFrequencyVisualizer(QWidget):
         
         # 1. Waveform plot - raw audio signal in time domain
         self.ax_wave = self.figure.add_subplot(gs[0])
-        self.ax_wave.plot(self.time, self.audio_data, color='b', linewidth=0.5, alpha=0.7)
+        self.ax_wave.plot(*self._downsample_for_plot(self.audio_data, self.sample_rate),
+                          color='b', linewidth=0.5, alpha=0.7)
         self.playback_lines.append(self.ax_wave.axvline(x=0, color='r', linewidth=1, animated=True))
         
         # 2. Amplitude envelope plot - smoothed amplitude over time
         self.ax_env = self.figure.add_subplot(gs[1], sharex=self.ax_wave)
         amplitude = np.abs(self.audio_data)
         smooth_window = int(0.02 * self.sample_rate)  # 20ms smoothing window
-        amplitude_smooth = np.convolve(amplitude, np.ones(smooth_window)/smooth_window, mode='same')
-        self.ax_env.plot(self.time, amplitude_smooth, 'b-', linewidth=1)
+        # Running-mean box filter: O(N) instead of the O(N*W) convolution;
+        # zero padding at the edges matches np.convolve(mode='same')
+        amplitude_smooth = uniform_filter1d(amplitude, size=smooth_window, mode='constant')
+        self.ax_env.plot(*self._downsample_for_plot(amplitude_smooth, self.sample_rate), 'b-', linewidth=1)
         self.playback_lines.append(self.ax_env.axvline(x=0, color='r', linewidth=1, animated=True))
         
         # 3. Spectrogram plot - time-frequency representation
         self.ax_spec = self.figure.add_subplot(gs[2], sharex=self.ax_wave)
-        # Compute Short-Time Fourier Transform
-        D = librosa.stft(self.audio_data,
-                        n_fft=self.window_size_spin.value(),
-                        hop_length=self.hop_size_spin.value(),
-                        win_length=self.window_size_spin.value())
-        S_db = librosa.amplitude_to_db(np.abs(D), ref=np.max)  # Convert to dB scale
-        # Display spectrogram with viridis colormap
-        librosa.display.specshow(S_db,
-                               sr=self.sample_rate,
-                               hop_length=self.hop_size_spin.value(),
-                               x_axis='time',
-                               y_axis='linear',
-                               ax=self.ax_spec,
-                               cmap='viridis',
-                               vmin=-60,  # Dynamic range limits
-                               vmax=0)
+        # Short-Time Fourier Transform in dB, computed block by block
+        S_db = self._spectrogram_db(self.window_size_spin.value(), self.hop_size_spin.value())
+        # Display spectrogram with viridis colormap as a single image rather
+        # than specshow's per-bin QuadMesh, which is far cheaper to redraw
+        hop = self.hop_size_spin.value()
+        self.ax_spec.imshow(S_db,
+                            aspect='auto',
+                            origin='lower',
+                            extent=[0, S_db.shape[1] * hop / self.sample_rate,
+                                    0, self.sample_rate / 2],
+                            cmap='viridis',
+                            vmin=-60,  # Dynamic range limits
+                            vmax=0,
+                            interpolation='nearest',
+                            rasterized=True)
+        self.ax_spec.set_xlabel("Time")
+        self.ax_spec.set_ylabel("Hz")
         self.playback_lines.append(self.ax_spec.axvline(x=0, color='r', linewidth=1, animated=True))
         
         # 4. Real-time FFT plot - high-resolution frequency spectrum
         self.ax_fft = self.figure.add_subplot(gs[3])
-        freqs = np.fft.rfftfreq(self.fft_size, 1/self.sample_rate)  # Frequency bins
-
-        # Initialize FFT line and peak markers
-        self.fft_line, = self.ax_fft.semilogx(freqs, np.zeros_like(freqs), 'b-', linewidth=0.8)
-        self.peak_markers, = self.ax_fft.plot([], [], 'ro', markersize=4, alpha=0.7)
+        # Initialize FFT line and peak markers (x data is fixed at the bin frequencies)
+        # Both are animated so they stay out of the cached background
+        self.fft_line, = self.ax_fft.semilogx(self.freqs, np.zeros_like(self.freqs), 'b-',
+                                              linewidth=0.8, animated=True)
+        self.peak_markers, = self.ax_fft.plot([], [], 'ro', markersize=4, alpha=0.7, animated=True)
 
         # Enhanced FFT plot styling
         self.ax_fft.set_title("High-Resolution Frequency Spectrum", pad=8)
@@ -358,89 +484,290 @@ class BeatFrequencyVisualizer(QWidget):
         self.ax_spec.set_title("Spectrogram")
         
         # Set axis limits and labels for coordinated display
-        self.ax_wave.set_xlim(0, self.time[-1])  # Full audio duration
+        self.ax_wave.set_xlim(0, len(self.audio_data) / self.sample_rate)  # Full audio duration
         self.ax_spec.set_ylim(0, self.max_freq_spin.value())  # User-defined frequency limit
         self.figure.tight_layout(rect=[0, 0, 1, 0.95])  # Adjust layout to fit window
         
-        # Draw everything and cache background for blitting
+        # Draw everything; _on_canvas_draw caches one background per axes
         self.canvas.draw()
-        self.background = self.canvas.copy_from_bbox(self.figure.bbox)
+
+    def _on_canvas_draw(self, event):
+        """
+        Recapture the blit backgrounds after every full canvas draw.
+        
+        A resize or a toolbar pan/zoom redraws the figure at a new size or
+        view, which makes previously cached backgrounds stale. The animated
+        artists (cursors, FFT line, peak markers) are excluded from a full
+        draw, so they are drawn back on top once the backgrounds are saved.
         
-        # Enable animation for all playback cursor lines
+        Args:
+            event: Matplotlib draw event
+        """
+        if not self.playback_lines:
+            return  # Nothing plotted yet
+        self.backgrounds = {ax: self.canvas.copy_from_bbox(ax.bbox)
+                            for ax in (self.ax_wave, self.ax_env, self.ax_spec, self.ax_fft)}
+        self.ax_fft.draw_artist(self.fft_line)
+        self.ax_fft.draw_artist(self.peak_markers)
         for line in self.playback_lines:
-            line.set_animated(True)
+            line.axes.draw_artist(line)
+
+    def _update_freq_ylim(self, max_freq):
+        """
+        Apply a new spectrogram frequency limit without replotting.
+        
+        The STFT and the other axes do not depend on the limit, so only
+        the view is changed and the canvas redrawn once.
+        
+        Args:
+            max_freq: Upper frequency limit in Hz
+        """
+        if not self.backgrounds:
+            return  # Nothing plotted yet; plot_spectrogram reads the spinbox
+        self.ax_spec.set_ylim(0, max_freq)
+        self.canvas.draw()  # Backgrounds are recaptured by _on_canvas_draw
+
+    def _spectrogram_db(self, n_fft, hop_length, block_frames=2048):
+        """
+        Compute the dB spectrogram of the loaded audio in blocks of frames.
+        
+        Equivalent to librosa.amplitude_to_db(np.abs(librosa.stft(...)),
+        ref=np.max), but dB values come straight from the squared magnitude
+        (see _stft_to_db) and only one block of the complex STFT exists at a
+        time, so peak memory for long files is the float32 result plus a
+        small working set instead of the full complex matrix and its
+        magnitude copy.
+        
+        Args:
+            n_fft: FFT / window length in samples
+            hop_length: Hop between frames in samples
+            block_frames: Number of STFT frames computed per block
+            
+        Returns:
+            np.ndarray: (1 + n_fft // 2, n_frames) float32 array in dB,
+            0 dB at the loudest bin and floored at -80 dB
+        """
+        # Same framing as librosa.stft(center=True) with its zero padding
+        y = np.pad(self.audio_data, n_fft // 2)
+        n_frames = 1 + (len(y) - n_fft) // hop_length
+        S_db = np.empty((1 + n_fft // 2, n_frames), dtype=np.float32)
+
+        for f0 in range(0, n_frames, block_frames):
+            f1 = min(f0 + block_frames, n_frames)
+            segment = y[f0 * hop_length:(f1 - 1) * hop_length + n_fft]
+            D = librosa.stft(segment, n_fft=n_fft, hop_length=hop_length,
+                             win_length=n_fft, center=False)
+            block = S_db[:, f0:f1]
+            if NUMBA_AVAILABLE:
+                _stft_to_db(D, block)
+            else:
+                # 10*log10(re^2 + im^2) == 20*log10(|D|) without the sqrt
+                np.multiply(D.real, D.real, out=block)
+                block += np.square(D.imag)
+                np.maximum(block, 1e-10, out=block)
+                np.log10(block, out=block)
+                block *= 10.0
+
+        # ref=np.max and top_db=80, applied once the global maximum is known
+        S_db -= S_db.max()
+        np.maximum(S_db, -80.0, out=S_db)
+        return S_db
+
+    def _downsample_for_plot(self, y, fs, target=4000):
+        """
+        Reduce a long signal to a min/max envelope for display.
+        
+        The axes are only about a thousand pixels wide, so plotting every
+        sample wastes render time. The signal is split into `target` bins
+        and each bin contributes its minimum and maximum, which keeps the
+        visible outline (including peaks) of the full-resolution plot.
+        Times are computed from sample indices only for the plotted points.
+        
+        Args:
+            y: Signal samples
+            fs: Sample rate in Hz
+            target: Number of bins to reduce to
+            
+        Returns:
+            tuple: (t, y) arrays to plot, y unchanged if already short enough
+        """
+        if len(y) <= 2 * target:
+            return np.arange(len(y)) / fs, y
+
+        stride = len(y) // target
+        n = stride * target
+        bins = y[:n].reshape(target, stride)
+        envelope = np.empty(2 * target, dtype=y.dtype)
+        envelope[0::2] = bins.min(axis=1)
+        envelope[1::2] = bins.max(axis=1)
+        return np.repeat(np.arange(0, n, stride) / fs, 2), envelope
+
+    def _find_spectral_peaks(self, db, spacing, height=-40):
+        """
+        Locate spectral peaks for the FFT markers with vectorized comparisons.
+        
+        A bin is a peak when it is above `height` and higher than both
+        neighbours; of the peaks falling in the same group of `spacing`
+        bins only the strongest is kept, so ripples on one lobe do not
+        produce a cluster of markers.
+        
+        Args:
+            db: Normalized dB spectrum
+            spacing: Group width in bins for the one-peak-per-group rule
+            height: Minimum level in dB for a peak
+            
+        Returns:
+            np.ndarray: Bin indices of the detected peaks
+        """
+        mid = db[1:-1]
+        mask = (mid > db[:-2]) & (mid >= db[2:]) & (mid > height)
+        peaks = np.flatnonzero(mask) + 1
+        if len(peaks) < 2:
+            return peaks
+
+        # Strongest peak per group: peaks are sorted, so groups are contiguous
+        levels = db[peaks]
+        _, starts = np.unique(peaks // spacing, return_index=True)
+        group_max = np.maximum.reduceat(levels, starts)
+        counts = np.diff(np.append(starts, len(peaks)))
+        return peaks[levels == np.repeat(group_max, counts)]
 
     def update_playback_cursor(self, position):
         """
-        Update playback cursor position and real-time FFT analysis.
+        Move the playback cursor lines to the current position.
         
-        This method is called continuously during audio playback to:
-        - Update the vertical cursor lines across all plots
-        - Perform real-time FFT analysis on the current audio frame
-        - Detect and mark spectral peaks in the FFT display
-        - Use blitting for smooth, efficient visual updates
+        Connected to the media player's positionChanged signal. Only the
+        cheap cursor update happens here; the real-time FFT runs on its
+        own timer (see update_fft) so it is not tied to notification
+        jitter. Uses blitting so only the three cursor axes are redrawn.
         
         Args:
             position: Current playback position in milliseconds
         """
         current_time = position / 1000  # Convert ms to seconds
-        
-        # Update real-time FFT only when audio is playing
+
+        # Skip updates that arrive faster than update_interval (e.g. queued
+        # notifications after a slow frame); explicit resets always apply
         if self.media_player.state() == QMediaPlayer.PlayingState:
-            start_sample = int(current_time * self.sample_rate)
-            end_sample = start_sample + self.window_size_spin.value()
-            
-            # Ensure we have enough samples for analysis
-            if end_sample < len(self.audio_data):
-                frame = self.audio_data[start_sample:end_sample]
-                
-                # Apply Blackman-Harris window to reduce spectral leakage
-                window = blackmanharris(len(frame))
-                frame_windowed = frame * window
-                
-                # Compute FFT with high resolution
-                fft_result = np.fft.rfft(frame_windowed, n=self.fft_size)
-                fft_magnitude = np.abs(fft_result)
-                fft_magnitude_db = 20 * np.log10(fft_magnitude + 1e-8)  # Convert to dB
-                fft_magnitude_db -= np.max(fft_magnitude_db)  # Normalize so 0 dB is peak
-                fft_magnitude_db = np.clip(fft_magnitude_db, -60, 0)  # Clamp dynamic range
-
-                # Update FFT plot data
-                freqs = np.fft.rfftfreq(self.fft_size, 1/self.sample_rate)
-                self.fft_line.set_data(freqs, fft_magnitude_db) 
-
-                # Find and mark spectral peaks for easy frequency identification
-                peaks, _ = find_peaks(fft_magnitude_db, height=-40, prominence=6, width=2)
-                if len(peaks) > 0:
-                    self.peak_markers.set_data(freqs[peaks], fft_magnitude_db[peaks])
-                else:
-                    self.peak_markers.set_data([], [])  # Clear markers if no peaks
-                        
+            now = time.monotonic()
+            if now - self.last_update_time < self.update_interval:
+                return
+            self.last_update_time = now
+
         # Update playback cursors for all plots
         for line in self.playback_lines:
             line.set_xdata([current_time, current_time])
+
+        # Nothing is drawn while the tab is hidden or the window minimized;
+        # the cursor positions above are still kept current
+        if not self.backgrounds or not self._canvas_shown():
+            return
+        try:
+            # Restore, redraw and blit only the axes holding a cursor
+            for line in self.playback_lines:
+                self.canvas.restore_region(self.backgrounds[line.axes])
+                line.axes.draw_artist(line)
+                self.canvas.blit(line.axes.bbox)
+        except Exception as e:
+            print(f"Blitting error: {e}")
+            # Fallback to full redraw if blitting fails
+            self.canvas.draw()
+
+    def update_fft(self):
+        """
+        Update the real-time FFT panel from the current playback position.
         
-        # Use blitting for efficient, smooth updates
-        if hasattr(self, 'background'):
-            try:
-                # Restore cached background
-                self.canvas.restore_region(self.background)
-                
-                # Redraw FFT plot if playing (most frequently changing element)
-                if self.media_player.state() == QMediaPlayer.PlayingState:
-                    self.ax_fft.draw_artist(self.fft_line)
-                    self.ax_fft.draw_artist(self.peak_markers)
-                
-                # Redraw cursor lines on all plots
-                for line in self.playback_lines:
-                    line.axes.draw_artist(line)
-                
-                # Blit the updated regions to canvas
-                self.canvas.blit(self.figure.bbox)
-            except Exception as e:
-                print(f"Blitting error: {e}")
-                # Fallback to full redraw if blitting fails
-                self.canvas.draw()
+        Called by fft_timer while audio is playing. Analyzes the window of
+        samples starting at the player's position, marks spectral peaks
+        and blits only the FFT axes.
+        """
+        if (self.audio_data is None or not self.backgrounds
+                or not self._canvas_shown()):
+            return
+        current_time = self.media_player.position() / 1000  # Convert ms to seconds
+        start_sample = int(current_time * self.sample_rate)
+        end_sample = start_sample + self.window_size_spin.value()
+        
+        # Ensure we have enough samples for analysis
+        if end_sample >= len(self.audio_data):
+            return
+        frame = self.audio_data[start_sample:end_sample]
+        
+        # Apply Blackman-Harris window to reduce spectral leakage. The
+        # window only changes with the spinbox, so it is cached per size.
+        n = len(frame)
+        window = self._window_cache.get(n)
+        if window is None:
+            window = self._window_cache[n] = blackmanharris(n).astype(np.float32)
+        if self._fft_in_len != n:
+            # Clear whatever a longer previous frame left past the new end
+            self._fft_in[n:] = 0
+            self._fft_in_len = n
+        # Window straight into the zero-padded float32 FFT input
+        np.multiply(frame, window, out=self._fft_in[:n])
+        
+        # Compute FFT with high resolution. The buffer's zero tail is the
+        # padding, so it must not be overwritten; float32 in -> complex64 out.
+        fft_magnitude_db = self._db_buf
+        if CUPY_AVAILABLE:
+            # FFT and dB conversion on the GPU; only the result comes back
+            gpu_db = _gpu_spectrum_db(cufft.rfft(cp.asarray(self._fft_in)))
+            gpu_db -= gpu_db.max()  # Normalize so 0 dB is peak
+            cp.clip(gpu_db, -60, 0, out=gpu_db)  # Clamp dynamic range
+            gpu_db.get(out=fft_magnitude_db)
+        elif NUMBA_AVAILABLE:
+            # Compiled single pass into the preallocated dB buffer
+            fft_result = rfft(self._fft_in, workers=-1)
+            _spectrum_to_db(fft_result.real, fft_result.imag, fft_magnitude_db)
+        else:
+            # Same steps in place on preallocated buffers, no temporaries
+            fft_result = rfft(self._fft_in, workers=-1)
+            fft_magnitude = np.abs(fft_result, out=self._mag_buf)
+            np.maximum(fft_magnitude, 1e-8, out=fft_magnitude)  # Floor before the log
+            np.log10(fft_magnitude, out=fft_magnitude_db)
+            fft_magnitude_db *= 20.0  # Convert to dB
+            fft_magnitude_db -= fft_magnitude_db.max()  # Normalize so 0 dB is peak
+            np.clip(fft_magnitude_db, -60, 0, out=fft_magnitude_db)  # Clamp dynamic range
+
+        # Update FFT plot data; the x data never changes
+        freqs = self.freqs
+        self.fft_line.set_ydata(fft_magnitude_db)
+
+        # Find and mark spectral peaks for easy frequency identification
+        # At most one peak per original (unpadded) bin width
+        peaks = self._find_spectral_peaks(fft_magnitude_db, max(2, self.fft_size // n))
+        if len(peaks) > 0:
+            self.peak_markers.set_data(freqs[peaks], fft_magnitude_db[peaks])
+        else:
+            self.peak_markers.set_data([], [])  # Clear markers if no peaks
+
+        # Blit only the FFT axes
+        try:
+            self.canvas.restore_region(self.backgrounds[self.ax_fft])
+            self.ax_fft.draw_artist(self.fft_line)
+            self.ax_fft.draw_artist(self.peak_markers)
+            self.canvas.blit(self.ax_fft.bbox)
+        except Exception as e:
+            print(f"Blitting error: {e}")
+            self.canvas.draw()
+
+    def _canvas_shown(self):
+        """
+        Whether the canvas is currently on screen (visible, not minimized).
+        """
+        return self.canvas.isVisible() and not self.window().isMinimized()
+
+    def _on_player_state_changed(self, state):
+        """
+        Run the FFT timer only while audio is playing.
+        
+        Args:
+            state: New QMediaPlayer state
+        """
+        if state == QMediaPlayer.PlayingState:
+            self.fft_timer.start()
+        else:
+            self.fft_timer.stop()
 
     def load_audio_files_list(self):
         """
@@ -465,10 +792,7 @@ class BeatFrequencyVisualizer(QWidget):
                 return
 
             # Find all WAV files in recordings directory
-            files = [
-                f for f in os.listdir(self.recordings_dir)
-                if f.lower().endswith(".wav")
-            ]
+            files = _list_wav_files(self.recordings_dir)
                                     
             if not files:
                 self.file_combo.addItem("No WAV files found in recordings")
@@ -481,8 +805,7 @@ class BeatFrequencyVisualizer(QWidget):
                 return
             
             # Add sorted list of files to dropdown
-            for file in sorted(files):
-                self.file_combo.addItem(file)
+            self.file_combo.addItems(files)
             
             # Try to select beat.wav by default if it exists
             beat_index = self.file_combo.findText("beat.wav")
@@ -516,13 +839,19 @@ class BeatFrequencyVisualizer(QWidget):
             self.media_player.stop()
             self.play_btn.setText("Play")  # Reset button text
             
+            # Drop the previous file's samples (and its temporary file, if any)
+            self.release_audio_data()
+
             # Load audio file using librosa with consistent sample rate
             self.audio_data, self.sample_rate = librosa.load(
                 file_path, 
                 sr=44100,  # Standardize to 44.1kHz
                 mono=True   # Force mono for consistent analysis
             )
-            self.time = np.arange(len(self.audio_data)) / self.sample_rate
+            if self.audio_data.nbytes > MMAP_THRESHOLD_BYTES:
+                self.audio_data = self.memory_map_audio(self.audio_data)
+            # FFT bin frequencies only depend on fft_size and the sample rate
+            self.freqs = np.fft.rfftfreq(self.fft_size, 1/self.sample_rate)
             
             # Set up media player with the selected file
             url = QUrl.fromLocalFile(file_path)
@@ -542,9 +871,48 @@ class BeatFrequencyVisualizer(QWidget):
         Stops audio playback and clears media resources to ensure
         clean application shutdown.
         """
+        self.fft_timer.stop()
         self.media_player.stop()
         self.media_player.setMedia(QMediaContent())  # Clear media
-        # Clear any other resources if needed
+        self.release_audio_data()
+
+    def memory_map_audio(self, samples):
+        """
+        Move decoded samples to a memory-mapped temporary .npy file.
+        
+        Used for long recordings: the real-time FFT only reads one window
+        of samples per update, so the operating system pages in just what
+        is needed instead of keeping the whole signal resident.
+        
+        Args:
+            samples: Decoded float32 audio signal
+            
+        Returns:
+            np.memmap: Read-only memory-mapped view of the samples
+        """
+        fd, path = tempfile.mkstemp(suffix='.npy', prefix='signalvisualizer_')
+        with os.fdopen(fd, 'wb') as f:
+            np.save(f, samples)
+        mapped = np.load(path, mmap_mode='r')
+        if os.name == 'posix':
+            # The mapping stays valid after unlink, and the file can never be left behind
+            os.remove(path)
+        else:
+            # Windows can't delete a mapped file; release_audio_data removes it
+            self._mmap_path = path
+        return mapped
+
+    def release_audio_data(self):
+        """
+        Drop the loaded audio and delete its memory-mapped file, if any.
+        """
+        self.audio_data = None
+        if self._mmap_path is not None:
+            try:
+                os.remove(self._mmap_path)
+            except OSError as e:
+                print(f"Could not remove temporary audio file {self._mmap_path}: {e}")
+            self._mmap_path = None
 
     def toggle_playback(self):
         """
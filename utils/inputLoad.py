@@ -15,9 +15,9 @@ Key Features:
 
 Dependencies:
 - numpy: Numerical computations
-- sounddevice: Audio playback
+- sounddevice: Audio playback (imported on first use)
 - soundfile: Audio file I/O
-- librosa: Audio analysis and processing
+- librosa: MP3 decoding, imported on first use and cached in ~/.cache/signalviz
 - PyQt5: Graphical user interface
 - matplotlib: Plotting and visualization
 
@@ -28,14 +28,16 @@ Version: 1.0
 """
 
 import numpy as np
-import sounddevice as sd
 import soundfile as sf
-import librosa
 import struct
+import hashlib
+import json
+from collections import deque
+from functools import lru_cache
 from pathlib import Path
 from PyQt5.QtWidgets import (QApplication, QWidget, QLabel, QPushButton, 
                             QVBoxLayout, QHBoxLayout, QFileDialog, QMessageBox)
-from PyQt5.QtCore import Qt
+from PyQt5.QtCore import Qt, QObject, QRunnable, QThreadPool, pyqtSignal
 from PyQt5.QtGui import QFont
 
 from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
@@ -49,6 +51,99 @@ import os
 # Maximum number of control windows that can be open simultaneously
 MAX_WINDOWS = 5
 
+# Formats read directly through libsndfile; anything else (MP3) is decoded by librosa
+SOUNDFILE_EXTENSIONS = ('.wav', '.flac', '.ogg', '.aiff', '.aif')
+
+# Decoded librosa output is cached here so reopening a file is a memory map, not a decode
+DECODE_CACHE_DIR = Path.home() / ".cache" / "signalviz"
+DECODE_CACHE_MAX_FILES = 8  # Oldest cached decodes beyond this are deleted
+
+# Decoded MP3 signals held in RAM (not memory-mapped) above this size are dropped
+# after plotting; selections are then decoded on demand (about 6 min at 44.1 kHz)
+MAX_RESIDENT_AUDIO_BYTES = 64 * 1024 * 1024
+
+def downmix_frames(block):
+    """
+    Average a (frames, channels) block from soundfile to mono float32.
+    
+    Stereo, the common case, is summed column by column into one output
+    array and halved in place; other channel counts use a float32 mean.
+    
+    Args:
+        block: float32 array of interleaved frames, one column per channel
+        
+    Returns:
+        numpy array with one mono sample per frame
+    """
+    if block.shape[1] == 2:
+        mono = np.add(block[:, 0], block[:, 1])
+        mono *= 0.5
+        return mono
+    return block.mean(axis=1, dtype=np.float32)
+
+
+@lru_cache(maxsize=None)
+def library_base_dir():
+    """
+    Directory that contains the application's 'library' folder.
+    
+    Depends only on how the program was started (source, frozen executable,
+    macOS .app bundle or Linux AppImage), so it is resolved once per run.
+    
+    Returns:
+        Path of the base directory
+    """
+    # Determine the base directory
+    if getattr(sys, 'frozen', False):
+        # Running as compiled executable
+        base_dir = Path(sys.executable).parent
+        
+        # Special handling for macOS .app bundle
+        if sys.platform == 'darwin' and '.app' in str(base_dir):
+            # For macOS .app, go up to the .app bundle directory
+            base_dir = base_dir.parent.parent.parent
+        # Special handling for Linux AppImage
+        elif sys.platform == 'linux' and 'APPIMAGE' in os.environ:
+            # For Linux AppImage, use the directory containing the AppImage
+            base_dir = Path(os.environ['APPIMAGE']).parent
+    else:
+        # Running from source
+        base_dir = Path(__file__).parent.parent
+    
+    return base_dir
+
+
+class _DecodeSignals(QObject):
+    """Signals of a _DecodeJob, delivered to the GUI thread."""
+    finished = pyqtSignal(object)  # dict returned by Load.decodeFile
+    failed = pyqtSignal(str)
+
+
+class _DecodeJob(QRunnable):
+    """
+    Background task that decodes an audio file and builds its plot envelope.
+    
+    Runs Load.decodeFile on the global thread pool so long decodes do not
+    freeze the window; the result is applied by the Load page when the
+    finished signal arrives.
+    """
+
+    def __init__(self, loader, file_path, bins):
+        super().__init__()
+        self.loader = loader
+        self.file_path = file_path
+        self.bins = bins
+        self.signals = _DecodeSignals()
+
+    def run(self):
+        try:
+            result = self.loader.decodeFile(self.file_path, self.bins)
+        except Exception as e:
+            self.signals.failed.emit(str(e))
+            return
+        self.signals.finished.emit(result)
+
+
 class Load(QWidget):
     """
     Main widget for loading and visualizing audio files.
@@ -66,7 +161,8 @@ class Load(QWidget):
         selectedAudio: Currently selected audio segment as numpy array
         fs: Sample rate of loaded audio (default: 44100 Hz)
         file_path: Path to the currently loaded audio file
-        control_windows: List tracking all open control windows
+        duration: Duration of the loaded audio in seconds
+        control_windows: Deque tracking all open control windows, oldest first
         selected_span: Tuple storing the start and end time of selected segment
     """
     
@@ -81,11 +177,18 @@ class Load(QWidget):
         super().__init__(master)
         self.controller = controller
         self.master = master
-        self.selectedAudio = np.empty(1)  # Initialize empty audio array
+        self._sel_range = None  # Selected sample range (start, stop), None for no selection
         self.fs = 44100  # Default sample rate
         self.file_path = ""  # No file loaded initially
+        self.duration = 0  # Duration of the loaded audio in seconds
+        self._sf = None  # Open SoundFile for span reads (libsndfile formats only)
+        self._mono_gain = 1.0  # Gain applied after averaging channels to mono
+        self._audio_full = None  # Full-resolution signal of a decoded (non-streamed) file
+        self._n_samples = 0  # Number of samples in the loaded file
+        self._line = None  # Waveform line, created on the first load and then reused
+        self._library_dir = None  # File dialog start directory, resolved on first use
 
-        self.control_windows = []  # List to track all open control windows
+        self.control_windows = deque(maxlen=MAX_WINDOWS)  # Track all open control windows, oldest first
         self.selected_span = (0, 0)  # Track selected time span (start, end)
         
         self.controller = controller  # Reference to main controller
@@ -157,6 +260,7 @@ class Load(QWidget):
         self.ax = self.fig.add_subplot(111)  # Single subplot for audio waveform
         self.canvas = FigureCanvas(self.fig)  # Canvas for embedding matplotlib in Qt
         self.toolbar = NavigationToolbar(self.canvas, self)  # Toolbar for plot navigation
+        self.addLoadButton()  # Created once, hidden until a file is loaded
         
         # Add widgets to layout
         main_layout.addLayout(control_row)
@@ -165,29 +269,20 @@ class Load(QWidget):
         
         self.setLayout(main_layout)  # Apply the layout to this widget
         
-    def loadAudio(self):
+    def libraryDir(self):
         """
-        Load an audio file from disk and prepare it for visualization.
+        Starting directory for the file dialog, created on first use.
+        
+        Resolved and, if needed, created only once per page; later
+        clicks on 'Open Audio File' reuse the stored path.
+        
+        Returns:
+            Path of the library directory (or a fallback directory)
         """
-
-        # Determine the base directory
-        if getattr(sys, 'frozen', False):
-            # Running as compiled executable
-            base_dir = Path(sys.executable).parent
-            
-            # Special handling for macOS .app bundle
-            if sys.platform == 'darwin' and '.app' in str(base_dir):
-                # For macOS .app, go up to the .app bundle directory
-                base_dir = base_dir.parent.parent.parent
-            # Special handling for Linux AppImage
-            elif sys.platform == 'linux' and 'APPIMAGE' in os.environ:
-                # For Linux AppImage, use the directory containing the AppImage
-                base_dir = Path(os.environ['APPIMAGE']).parent
-        else:
-            # Running from source
-            base_dir = Path(__file__).parent.parent
+        if self._library_dir is not None:
+            return self._library_dir
         
-        library_dir = base_dir / "library"
+        library_dir = library_base_dir() / "library"
         
         # Create library directory if it doesn't exist
         if not library_dir.exists():
@@ -210,6 +305,16 @@ class Load(QWidget):
         if not library_dir.exists():
             library_dir = Path.home() / "Documents"  # Ultimate fallback
         
+        self._library_dir = library_dir
+        return library_dir
+
+    def loadAudio(self):
+        """
+        Load an audio file from disk and prepare it for visualization.
+        """
+
+        library_dir = self.libraryDir()
+        
         # Open file dialog
         file_path, _ = QFileDialog.getOpenFileName(
             self, 
@@ -221,70 +326,285 @@ class Load(QWidget):
         if not file_path:
             return
             
-        self.file_path = file_path
+        # Decode on the thread pool; the page stays responsive meanwhile
+        self.open_button.setEnabled(False)
+        self.open_button.setText('Loading...')
+        job = _DecodeJob(self, file_path, self.previewBins())
+        job.signals.finished.connect(self.onDecoded)
+        job.signals.failed.connect(self.onDecodeFailed)
+        self._decode_signals = job.signals  # Keep the signal object alive until delivery
+        QThreadPool.globalInstance().start(job)
+
+    def decodeFile(self, file_path, bins):
+        """
+        Decode an audio file and build its plot envelope (runs off the GUI thread).
+        
+        Does not touch widgets or page state; everything needed to show the
+        file is returned and applied by onDecoded.
+        
+        Args:
+            file_path: Path of the audio file to load
+            bins: Number of min/max bins for the plotted envelope
+            
+        Returns:
+            dict with the file path, open SoundFile (or None), sample rate,
+            sample count, stereo flag, mono gain, decoded signal (or None)
+            and the time/waveform arrays to plot
+        """
+        result = {'file_path': file_path, 'sf': None, 'mono_gain': 1.0, 'audio_full': None}
+        
+        if Path(file_path).suffix.lower() in SOUNDFILE_EXTENSIONS:
+            # Streamed block by block: only the plot envelope is kept in memory,
+            # and selections are read straight from the file, which stays open
+            f = sf.SoundFile(file_path)
+            try:
+                result['time'], result['waveform'], result['mono_gain'] = self.streamPreview(f, bins)
+            except Exception:
+                f.close()
+                raise
+            result.update(sf=f, fs=f.samplerate, n_samples=f.frames, stereo=f.channels > 1)
+            return result
+        
+        audio, fs = self.decodeCached(file_path)
+        stereo = audio.ndim > 1
+        # A downmix or an uncached decode lives in RAM rather than in the cache file
+        resident = stereo or not isinstance(audio, np.memmap)
+        if stereo:
+            # Average the channels, then restore the original peak level. Peaks
+            # come from max/min directly, avoiding an abs() copy of the signal.
+            ampMax = max(audio.max(), -audio.min())
+            mono = audio.mean(axis=0, dtype=np.float32)
+            result['mono_gain'] = ampMax / max(mono.max(), -mono.min())
+            mono *= result['mono_gain']
+            audio = mono
         
+        # float32 end to end halves the memory moved by plotting and playback
+        audio = np.ascontiguousarray(audio, dtype=np.float32)
+        result['time'], result['waveform'] = self.downsampleForPlot(audio, fs, bins)
+        if not (resident and audio.nbytes > MAX_RESIDENT_AUDIO_BYTES):
+            result['audio_full'] = audio  # Otherwise spans are decoded from the file instead
+        result.update(fs=fs, n_samples=len(audio), stereo=stereo)
+        return result
+
+    def onDecoded(self, result):
+        """
+        Show a file decoded by the background job.
+        
+        Args:
+            result: dict returned by decodeFile
+        """
+        self.restoreOpenButton()
+        self.closeAudioFile()  # Release the previous file's handle
+        
+        self.file_path = result['file_path']
+        self._sf = result['sf']
+        self.fs = result['fs']
+        self._n_samples = result['n_samples']
+        self._mono_gain = result['mono_gain']
+        self._audio_full = result['audio_full']
+        
+        if result['stereo']:
+            QMessageBox.warning(
+                self, 
+                "Stereo File", 
+                "This file is in stereo mode. It will be converted to mono."
+            )
+        
+        self.duration = self._n_samples / self.fs  # Known from the samples, no need to reopen
         try:
-            audio, self.fs = librosa.load(file_path, sr=None, mono=False)
+            self.plotAudio(result['time'], result['waveform'])
+        except Exception as e:
+            QMessageBox.critical(self, "Error", f"Could not load file: {str(e)}")
+
+    def onDecodeFailed(self, message):
+        """
+        Report a file the background job could not decode.
+        
+        Args:
+            message: Error description
+        """
+        self.restoreOpenButton()
+        QMessageBox.critical(self, "Error", f"Could not load file: {message}")
+
+    def restoreOpenButton(self):
+        """Re-enable the open button after a background decode."""
+        self.open_button.setEnabled(True)
+        self.open_button.setText('Open Audio File')
+
+    def decodeCached(self, file_path):
+        """
+        Decode a file with librosa, reusing a memory-mapped copy on disk.
+        
+        The decoded samples are stored as .npy in DECODE_CACHE_DIR, keyed by
+        the file's path, modification time and size, so opening the same
+        file again skips the decode. If the cache cannot be used the file
+        is simply decoded in memory.
+        
+        Args:
+            file_path: Path of the audio file to decode
             
-            if audio.ndim > 1:
-                QMessageBox.warning(
-                    self, 
-                    "Stereo File", 
-                    "This file is in stereo mode. It will be converted to mono."
-                )
-                ampMax = np.max(np.abs(audio))
-                audio = np.mean(audio, axis=0)
-                audio = audio * ampMax / np.max(np.abs(audio))
+        Returns:
+            Tuple (audio, fs) as returned by librosa.load(sr=None, mono=False)
+        """
+        import librosa  # Imported on first MP3 load; it is slow to import
+        
+        try:
+            st = os.stat(file_path)
+            key = hashlib.blake2b(f"{file_path}|{st.st_mtime_ns}|{st.st_size}".encode()).hexdigest()
+            data_path = DECODE_CACHE_DIR / f"{key}.npy"
+            info_path = DECODE_CACHE_DIR / f"{key}.json"
+            if data_path.exists() and info_path.exists():
+                fs = json.loads(info_path.read_text())["fs"]
+                return np.load(data_path, mmap_mode='r'), fs
+        except (OSError, ValueError, KeyError) as e:
+            print(f"Decode cache unavailable: {e}")
+            return librosa.load(file_path, sr=None, mono=False)
+        
+        audio, fs = librosa.load(file_path, sr=None, mono=False)
+        try:
+            DECODE_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            np.save(data_path, audio)
+            info_path.write_text(json.dumps({"fs": fs}))  # Written last: marks the entry complete
             
-            self.plotAudio(audio)
+            # Keep only the most recently written decodes
+            cached = sorted(DECODE_CACHE_DIR.glob("*.npy"), key=lambda p: p.stat().st_mtime)
+            for old in cached[:-DECODE_CACHE_MAX_FILES]:
+                old.unlink()
+                old.with_suffix(".json").unlink(missing_ok=True)
             
-        except Exception as e:
-            QMessageBox.critical(self, "Error", f"Could not load file: {str(e)}")
+            # Hand back the memory-mapped copy so the decoded array can be freed
+            return np.load(data_path, mmap_mode='r'), fs
+        except OSError as e:
+            print(f"Could not cache decoded audio: {e}")
+        return audio, fs
 
-    def plotAudio(self, audio):
+    def plotAudio(self, time, waveform):
         """
         Plot the audio waveform and set up interactive controls.
         
         Args:
-            audio: numpy array containing the audio data to visualize
+            time: numpy array of time values for x-axis
+            waveform: numpy array of samples (or min/max envelope) to visualize
         """
-        self.ax.clear()  # Clear previous plot
-
         # Reset selected span when loading new audio
         self.selected_span = None
-        self.selectedAudio = np.empty(1)  # Reset selected audio
+        self._sel_range = None  # Reset selected audio
+        
+        duration = self.duration
         
-        # Calculate time array for x-axis
-        duration = librosa.get_duration(filename=self.file_path)
-        time = np.linspace(0, duration, len(audio), endpoint=False)
+        if self._line is None:
+            # First file: create the artists and widgets once; later files reuse them
+            # Rasterized: saved figures embed the waveform as an image, not a huge path
+            self._line, = self.ax.plot(time, waveform, linewidth=1, rasterized=True)
+            self._zero = self.ax.axhline(y=0, color='black', linewidth=0.5, linestyle='--')  # Zero reference line
+            self.ax.set(xlabel='Time (s)', ylabel='Amplitude')
+            self.ax.grid(True, linestyle=':', alpha=0.5)  # Add grid lines
+            
+            # Show the play/stop/load buttons created in setupUI
+            for ax in (self.play_button_ax, self.stop_button_ax, self.load_button_ax):
+                ax.set_visible(True)
+            
+            # Setup span selector for interactive audio selection
+            self.setupSpanSelector()
+        else:
+            self._line.set_data(time, waveform)
+            self.span.clear()  # Hide the previous file's selection
+            self.toolbar.update()  # Forget zoom/pan history of the previous file
         
-        # Plot the audio waveform
-        self.ax.plot(time, audio, linewidth=1)
-        self.ax.axhline(y=0, color='black', linewidth=0.5, linestyle='--')  # Zero reference line
         self.ax.set(
             xlim=[0, duration],  # Set x-axis limits to full duration
-            xlabel='Time (s)',
-            ylabel='Amplitude',
             title=Path(self.file_path).stem  # Use filename without extension as title
         )
-        self.ax.grid(True, linestyle=':', alpha=0.5)  # Add grid lines
+        self.ax.relim()
+        self.ax.autoscale_view(scalex=False)
         
-        # Add load button to the plot
-        self.addLoadButton()
+        self.canvas.draw_idle()  # Refresh the canvas once control returns to the event loop
         
-        # Setup span selector for interactive audio selection
-        self.setupSpanSelector(time, audio)
+    def downsampleForPlot(self, audio, fs, bins):
+        """
+        Reduce the waveform to a min/max envelope about two points per pixel.
+        
+        The canvas is only a few thousand pixels wide, so plotting every
+        sample wastes draw time. Each bin of samples contributes its minimum
+        and maximum, which keeps the visible outline and peaks of the signal.
+        Time values are only generated for the plotted points, never for
+        every sample.
         
-        self.canvas.draw()  # Refresh the canvas to show new plot
+        Args:
+            audio: numpy array of audio data for y-axis
+            fs: Sample rate in Hz
+            bins: Number of min/max bins (see previewBins)
+            
+        Returns:
+            Tuple (time, audio) to plot, audio unchanged if already short enough
+        """
+        target = bins
+        if len(audio) <= 2 * target:
+            time = np.arange(len(audio), dtype=np.float32)
+            time *= np.float32(1.0 / fs)
+            return time, audio
         
-    def setupSpanSelector(self, time, audio):
+        block = len(audio) // target
+        blocks = audio[:target * block].reshape(target, block)
+        envelope = np.stack([blocks.min(axis=1), blocks.max(axis=1)], axis=1).ravel()
+        time = np.arange(target, dtype=np.float32)
+        time *= np.float32(block / fs)
+        return np.repeat(time, 2), envelope
+
+    def previewBins(self):
+        """Number of min/max bins for the plotted envelope, two per canvas pixel."""
+        return max(2048, 2 * self.canvas.width())
+
+    def streamPreview(self, f, bins, blocksize=1 << 20):
         """
-        Set up the span selector for interactive time segment selection.
+        Build the plotted min/max envelope by streaming an open sound file.
+        
+        The file is read in blocks of about a million frames, so memory use
+        does not depend on its length. Multichannel blocks are averaged to
+        mono while tracking the input and output peaks, which gives the
+        same downmix gain as converting the whole signal at once.
         
         Args:
-            time: numpy array of time values for x-axis
-            audio: numpy array of audio data for y-axis
+            f: Open soundfile.SoundFile
+            bins: Number of min/max bins (see previewBins)
+            blocksize: Approximate number of frames read per block
+            
+        Returns:
+            Tuple (time, envelope, mono_gain): arrays to plot and the downmix gain
         """
+        step = max(1, f.frames // bins)  # Samples per envelope bin
+        n_bins = -(-f.frames // step)
+        bins_per_block = max(1, blocksize // step)
+        mins = np.empty(n_bins, dtype=np.float32)
+        maxs = np.empty(n_bins, dtype=np.float32)
+        peak_in = peak_out = 0.0
+        
+        f.seek(0)
+        for i, block in enumerate(f.blocks(blocksize=bins_per_block * step, dtype='float32')):
+            if block.ndim > 1:
+                peak_in = max(peak_in, block.max(), -block.min())
+                block = downmix_frames(block)
+                peak_out = max(peak_out, block.max(), -block.min())
+            
+            # Blocks hold whole bins; only the last one can end in a partial bin
+            b0 = i * bins_per_block
+            k = len(block) // step
+            if k:
+                block_bins = block[:k * step].reshape(k, step)
+                block_bins.min(axis=1, out=mins[b0:b0 + k])
+                block_bins.max(axis=1, out=maxs[b0:b0 + k])
+            if k * step < len(block):
+                mins[b0 + k] = block[k * step:].min()
+                maxs[b0 + k] = block[k * step:].max()
+        
+        mono_gain = peak_in / peak_out if peak_out > 0 else 1.0
+        envelope = np.stack([mins, maxs], axis=1).ravel()
+        envelope *= mono_gain
+        time = np.repeat(np.arange(n_bins, dtype=np.float32) * np.float32(step / f.samplerate), 2)
+        return time, envelope, mono_gain
+
+    def setupSpanSelector(self):
+        """Set up the span selector for interactive time segment selection."""
         # Remove existing span selector if it exists
         if hasattr(self, 'span'):
             self.span.disconnect_events()
@@ -298,15 +618,16 @@ class Load(QWidget):
                 xmin: Start time of selected span (seconds)
                 xmax: End time of selected span (seconds)
             """
-            if len(audio) <= 1:  # Skip if no audio data
+            n = self._n_samples
+            if n <= 1:  # Skip if no audio data
                 return
                 
-            # Convert time values to sample indices
-            idx_min = np.argmax(time >= xmin)
-            idx_max = np.argmax(time >= xmax)
-            self.selectedAudio = audio[idx_min:idx_max]  # Extract selected audio segment
+            # Convert time values to sample indices; samples are evenly spaced
+            idx_min = min(max(int(round(xmin * self.fs)), 0), n)
+            idx_max = min(max(int(round(xmax * self.fs)), 0), n)
+            # Only the range is stored; the samples are fetched when played or loaded
+            self._sel_range = (idx_min, idx_max)
             self.selected_span = (xmin, xmax)  # Store the selected time span
-            sd.play(self.selectedAudio, self.fs)  # Play the selected segment
             
         # Create span selector widget
         self.span = SpanSelector(
@@ -318,118 +639,231 @@ class Load(QWidget):
             drag_from_anywhere=True  # Can drag from anywhere in the span
         )
 
+    @property
+    def selectedAudio(self):
+        """
+        Samples of the selected segment, or None when nothing is selected.
+        
+        Read from the open file when there is one, otherwise a view into
+        the full-resolution signal, so dragging the selection copies nothing.
+        """
+        if self._sel_range is None:
+            return None
+        return self.audioRange(*self._sel_range)
+
+    def audioRange(self, start, stop):
+        """
+        Mono samples of the loaded audio in [start, stop).
+        
+        Args:
+            start: First sample index
+            stop: Sample index one past the end of the range
+            
+        Returns:
+            numpy array read from the open file, or a view of the decoded signal
+        """
+        if self._sf is not None:
+            return self.readSpan(start, stop)
+        if self._audio_full is None:
+            return self.decodeSpan(start, stop)
+        return self._audio_full[start:stop]
+
+    def decodeSpan(self, start, stop):
+        """
+        Decode only a range of samples of a long MP3 file.
+        
+        Used when the decoded signal was too large to keep in memory.
+        librosa stops decoding at the end of the requested range, and the
+        channels are downmixed with the same gain as the waveform.
+        
+        Args:
+            start: First sample index
+            stop: Sample index one past the end of the range
+            
+        Returns:
+            numpy array with the mono samples in the range
+        """
+        import librosa
+        
+        block, _ = librosa.load(self.file_path, sr=None, mono=False,
+                                offset=start / self.fs, duration=(stop - start) / self.fs)
+        if block.ndim > 1:
+            block = block.mean(axis=0, dtype=np.float32)
+            block *= self._mono_gain
+        return block
+
+    def playSelection(self, event):
+        """
+        Play the currently selected audio segment.
+        
+        Args:
+            event: Matplotlib button click event
+        """
+        if self._sel_range is not None:  # Only if a selection was made
+            import sounddevice as sd  # Imported on first playback
+            sd.play(self.selectedAudio, self.fs)
+
+    def stopAudio(self, event):
+        """
+        Stop any audio being played.
+        
+        Args:
+            event: Matplotlib button click event
+        """
+        import sounddevice as sd
+        sd.stop()
+
+    def readSpan(self, start, stop):
+        """
+        Read a range of samples from the open audio file.
+        
+        Multichannel files are downmixed with the same gain as the
+        waveform, so the result matches slicing the plotted signal.
+        
+        Args:
+            start: First sample index
+            stop: Sample index one past the end of the range
+            
+        Returns:
+            numpy array with the mono samples in the range
+        """
+        self._sf.seek(start)
+        block = self._sf.read(max(0, stop - start), dtype='float32')
+        if block.ndim > 1:
+            block = downmix_frames(block)
+            block *= self._mono_gain
+        return block
+
+    def closeAudioFile(self):
+        """Close the handle of the currently open audio file, if any."""
+        if self._sf is not None:
+            self._sf.close()
+            self._sf = None
+
+    def cleanup(self):
+        """Release the open audio file when leaving the page."""
+        self.closeAudioFile()
+
     def format_timestamp(self, seconds):
         """
-        Convert seconds to mm:ss.xxx format for display.
+        Convert seconds to mm:ss.xx format for display.
         
         Args:
             seconds: Time in seconds
             
         Returns:
-            Formatted timestamp string (mm:ss.xxx)
+            Formatted timestamp string (mm:ss.xx)
         """
-        minutes = int(seconds // 60)
-        seconds = seconds % 60
-        return f"{minutes:02d}:{seconds:06.3f}"[:8]  # Truncate to mm:ss.xx format
+        hundredths = round(seconds * 1000) // 10  # Milliseconds truncated, as mm:ss.xxx[:8] did
+        return f"{hundredths // 6000:02d}:{hundredths // 100 % 60:02d}.{hundredths % 100:02d}"
 
     def addLoadButton(self):
-        """Add load and stop buttons to the plot interface."""
-        # Remove existing buttons if they exist
-        if hasattr(self, 'load_button_ax'):
-            self.fig.delaxes(self.load_button_ax)
-        if hasattr(self, 'stop_button_ax'):
-            self.fig.delaxes(self.stop_button_ax)
-            
-        # Create button axes for both buttons (position: [left, bottom, width, height])
+        """
+        Add play, stop and load buttons to the plot interface.
+        
+        Called once from setupUI. The buttons stay hidden until the first
+        file is plotted and are then reused for every later file.
+        """
+        # Create button axes for all buttons (position: [left, bottom, width, height])
+        self.play_button_ax = self.fig.add_axes([0.5, 0.01, 0.13, 0.05])
         self.stop_button_ax = self.fig.add_axes([0.65, 0.01, 0.12, 0.05])
         self.load_button_ax = self.fig.add_axes([0.8, 0.01, 0.15, 0.05])
         
+        # Create Play Selection button; selecting a span no longer starts playback
+        self.play_button = Button(self.play_button_ax, 'Play Selection')
+        self.play_button.on_clicked(self.playSelection)
+        
         # Create Stop Audio button
         self.stop_button = Button(self.stop_button_ax, 'Stop Audio')
-        self.stop_button.on_clicked(lambda event: sd.stop())  # Stop audio playback
+        self.stop_button.on_clicked(self.stopAudio)  # Stop audio playback
         
         # Create Load to Controller button
         self.load_button = Button(self.load_button_ax, 'Load to Controller')
+        self.load_button.on_clicked(self.loadToController)
         
-        def on_load(event):
-            """
-            Callback function for loading selected audio to control window.
-            
-            This function:
-            - Checks if maximum window limit is reached
-            - Determines whether to load selected segment or entire file
-            - Creates a new control window with the audio data
-            - Updates the windows tracking list
-            - Handles window closure cleanup
-            """
-            from core.controlMenu import ControlMenu  # Import here to avoid circular imports
+        for ax in (self.play_button_ax, self.stop_button_ax, self.load_button_ax):
+            ax.set_visible(False)  # Shown by plotAudio once a file is loaded
 
-            # Manage maximum number of open windows
-            if len(self.control_windows) >= MAX_WINDOWS:
-                oldest = self.control_windows.pop(0)  # Remove oldest window
-                oldest.close()  # Close the window
-                
-            # Determine which audio to load (selected segment or entire file)
-            if self.selectedAudio.shape == (1,):  # No selection made, use entire audio
-                audio_to_load = self.ax.lines[0].get_ydata()  # Get all audio data from plot
-                duration = len(audio_to_load) / self.fs  # Calculate duration
-                start_time = 0
-                end_time = duration
-            else:  # Use selected segment
-                audio_to_load = self.selectedAudio
-                duration = len(audio_to_load) / self.fs
-                start_time, end_time = self.selected_span
-                
-            # Create window title with appropriate information
-            name = Path(self.file_path).stem  # Filename without extension
-            if self.selectedAudio.shape != (1,):  # Only show span if selection was made
-                title = f"{name} {self.format_timestamp(start_time)}-{self.format_timestamp(end_time)}"
-            else:
-                title = name  # Just use filename for entire file
-                
-            # Create new control window with the audio data
-            control_window = ControlMenu(title, self.fs, audio_to_load, duration, self.controller)
+    def loadToController(self, event):
+        """
+        Load the selected audio (or the whole file) into a control window.
+        
+        This function:
+        - Checks if maximum window limit is reached
+        - Determines whether to load selected segment or entire file
+        - Creates a new control window with the audio data
+        - Updates the windows tracking list
+        - Handles window closure cleanup
+        
+        Args:
+            event: Matplotlib button click event
+        """
+        from core.controlMenu import ControlMenu  # Import here to avoid circular imports
+
+        # Manage maximum number of open windows
+        if len(self.control_windows) == MAX_WINDOWS:
+            oldest = self.control_windows.popleft()  # Remove oldest window in O(1)
+            oldest.close()  # Close the window
             
-            # Update windows menu in controller if available
-            if hasattr(self.controller, 'update_windows_menu'):
-                self.controller.update_windows_menu()
-                
-            # Store the title early since windowTitle() may fail later during cleanup
-            window_title = control_window.windowTitle()
+        # Determine which audio to load (selected segment or entire file)
+        if self._sel_range is None:  # No selection made, use entire audio
+            audio_to_load = self.audioRange(0, self._n_samples)  # The plotted line is only an envelope
+            duration = self.duration  # Stored when the file was loaded
+            start_time = 0
+            end_time = duration
+        else:  # Use selected segment
+            audio_to_load = np.ascontiguousarray(self.selectedAudio)  # Fetched once
+            start, stop = self._sel_range
+            duration = (stop - start) / self.fs
+            start_time, end_time = self.selected_span
             
-            def handle_close():
-                """
-                Cleanup function called when control window is closed.
-                
-                Removes the window from tracking list and performs cleanup.
-                """
-                try:
-                    # Check if window still exists in the list
-                    if control_window in self.control_windows:
-                        self.control_windows.remove(control_window)
-                        print(f"Removed window: '{window_title}'. Total windows: {len(self.control_windows)}")
-                        # Print all remaining windows for debugging
-                        print("Current windows:", [w.base_name for w in self.control_windows])
-                    else:
-                        print(f"Window '{window_title}' not found in control_windows list")
-                except RuntimeError:
-                    # This catches cases where the window is partially destroyed
-                    print(f"Window '{window_title}' already destroyed during cleanup")
-                
-            # Connect the destroyed signal to cleanup function
-            control_window.destroyed.connect(handle_close)
+        # Create window title with appropriate information
+        name = Path(self.file_path).stem  # Filename without extension
+        if self._sel_range is not None:  # Only show span if selection was made
+            title = f"{name} {self.format_timestamp(start_time)}-{self.format_timestamp(end_time)}"
+        else:
+            title = name  # Just use filename for entire file
             
-            # Add new window to tracking list
-            self.control_windows.append(control_window)
-            print(f"Added window: '{control_window.windowTitle()}'. Total windows: {len(self.control_windows)}")
-            print("All windows:", [w.base_name for w in self.control_windows])            
+        # Create new control window with the audio data
+        control_window = ControlMenu(title, self.fs, audio_to_load, duration, self.controller)
+        
+        # Update windows menu in controller if available
+        if hasattr(self.controller, 'update_windows_menu'):
+            self.controller.update_windows_menu()
             
-            control_window.show()  # Make window visible
-            control_window.activateWindow()  # Bring window to front
-
-        # Connect the load button to the callback function
-        self.load_button.on_clicked(on_load)
+        # Store the title early since windowTitle() may fail later during cleanup
+        window_title = control_window.windowTitle()
         
+        def handle_close():
+            """
+            Cleanup function called when control window is closed.
+            
+            Removes the window from tracking list and performs cleanup.
+            """
+            try:
+                # Check if window still exists in the list
+                if control_window in self.control_windows:
+                    self.control_windows.remove(control_window)
+                    print(f"Removed window: '{window_title}'. Total windows: {len(self.control_windows)}")
+                    # Print all remaining windows for debugging
+                    print("Current windows:", [w.base_name for w in self.control_windows])
+                else:
+                    print(f"Window '{window_title}' not found in control_windows list")
+            except RuntimeError:
+                # This catches cases where the window is partially destroyed
+                print(f"Window '{window_title}' already destroyed during cleanup")
+            
+        # Connect the destroyed signal to cleanup function
+        control_window.destroyed.connect(handle_close)
+        
+        # Add new window to tracking list
+        self.control_windows.append(control_window)
+        print(f"Added window: '{control_window.windowTitle()}'. Total windows: {len(self.control_windows)}")
+        print("All windows:", [w.base_name for w in self.control_windows])            
+        
+        control_window.show()  # Make window visible
+        control_window.activateWindow()  # Bring window to front
+
     def showHelp(self):
         """Display help information about using the audio loader."""
         QMessageBox.information(
@@ -437,7 +871,7 @@ class Load(QWidget):
             "Help", 
             "Audio File Loader Help\n\n"
             "1. Click 'Open Audio File' to browse for a WAV file\n"
-            "2. Select a portion of the audio with your mouse to play just that section\n"
+            "2. Select a portion of the audio with your mouse and click 'Play Selection' to hear it\n"
             "3. Click 'Load to Controller' to send the audio to the control menu\n"
             "   - If no selection is made, the entire file will be loaded"
         )
\ No newline at end of file
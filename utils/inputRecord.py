@@ -1,5 +1,6 @@
 import time
 import threading
+import concurrent.futures
 import numpy as np
 import soundfile as sf
 import sounddevice as sd
@@ -7,7 +8,7 @@ from scipy.io.wavfile import write
 from pathlib import Path
 from PyQt5.QtWidgets import (QSpinBox, QApplication, QWidget, QDialog, QLabel, QPushButton, 
                             QVBoxLayout, QHBoxLayout, QMessageBox)
-from PyQt5.QtCore import Qt, QTimer, QThread, pyqtSignal
+from PyQt5.QtCore import Qt, QTimer, pyqtSignal
 from PyQt5.QtGui import QFont
 from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
 from matplotlib.backends.backend_qt5agg import NavigationToolbar2QT as NavigationToolbar
@@ -22,66 +23,57 @@ except ImportError as e:
     print(f"Warning: Could not import ControlMenu: {e}")
     CONTROL_MENU_AVAILABLE = False
 
+# Number of min/max bins drawn for the recorded waveform
+PLOT_POINTS = 4000
+
+
+def _envelope(x, fs, target=PLOT_POINTS):
+    """Return (time, values) for a min/max envelope of x with about 2*target points"""
+    step = max(1, len(x) // target)
+    if step == 1:
+        time = np.arange(len(x), dtype=np.float32) / np.float32(fs)
+        return time, x
+    m = len(x) // step * step
+    v = x[:m].reshape(-1, step)
+    env = np.column_stack([v.min(axis=1), v.max(axis=1)]).ravel()
+    time = np.arange(len(v), dtype=np.float32) * np.float32(step / fs)
+    return np.repeat(time, 2), env
 
-class SoundDeviceRecordingThread(QThread):
-    frames_ready = pyqtSignal(np.ndarray)
-    recording_error = pyqtSignal(str)
-    
-    def __init__(self, fs, channels=1):
-        super().__init__()
-        self.fs = fs
-        self.channels = channels
-        self._is_recording = False
-        self.stream = None
-        
-    def run(self):
-        """Audio recording using sounddevice - much more reliable than PyAudio"""
-        try:
-            self._is_recording = True
-            self.frames = []
-            
-            def callback(indata, frames, time, status):
-                if status:
-                    print(f"Audio input status: {status}")
-                if self._is_recording:
-                    # Make a copy of the data to avoid reference issues
-                    data_copy = indata.copy()
-                    self.frames_ready.emit(data_copy)
-            
-            # Use sounddevice which is more reliable
-            with sd.InputStream(samplerate=self.fs, 
-                              channels=self.channels,
-                              callback=callback,
-                              blocksize=1024,
-                              dtype='float32'):
-                print("Recording started with sounddevice")
-                while self._is_recording:
-                    # Small sleep to prevent busy waiting
-                    self.msleep(10)
-                    
-        except Exception as e:
-            error_msg = f"Recording error: {str(e)}"
-            print(error_msg)
-            self.recording_error.emit(error_msg)
-            
-    def stop(self):
-        """Stop recording safely"""
-        self._is_recording = False
 
 class Record(QWidget):
+    # 0 lets PortAudio pick the device's natural period; override per platform if needed
+    BLOCKSIZE = 0
+    LATENCY = 'low'
+    
+    # Carries a finished envelope future from the worker back to the GUI thread
+    envelope_ready = pyqtSignal(object)
+    
     def __init__(self, master, controller):
         super().__init__(master)
         self.controller = controller
         self.master = master
         self.isrecording = False
         self.fs = 44100
-        self.selectedAudio = np.empty(1)
+        self.selectedAudio = None
         self.recording_start_time = 0
-        self.frames = []
+        self.pcm_buf = None
+        self.pcm_len = 0
+        self.stream = None
+        self._status_flags = 0
+        self.out_stream = None
+        self._play_lock = threading.Lock()
+        self._play_gen = 0
         self.control_windows = []
+        self._mic_ok = None
+        self._pool = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+        self.envelope_ready.connect(self._finish_plot)
         
         self.setupUI()
         
+        # Probe the microphone in the background so the first Record click is instant
+        self._mic_probe = threading.Thread(target=self._background_mic_probe, daemon=True)
+        self._mic_probe.start()
+        
     def setupUI(self):
         """Set up the user interface (same as before)"""
         self.setWindowTitle("Audio Recorder")
@@ -197,8 +189,11 @@ class Record(QWidget):
         control_row.addWidget(self.load_button)
         control_row.addStretch()
         
+        # The label shows whole seconds, so tick once a second on a precise timer
         self.timer = QTimer(self)
+        self.timer.setTimerType(Qt.PreciseTimer)
         self.timer.timeout.connect(self.update_time_display)
+        self._last_secs = 0
         
         self.auto_stop_timer = QTimer(self)
         self.auto_stop_timer.setSingleShot(True)
@@ -211,6 +206,12 @@ class Record(QWidget):
         
         self.canvas.setVisible(False)
         self.toolbar.setVisible(False)
+        # Static decorations are created once and never redrawn per recording
+        self.line, = self.ax.plot([], [])
+        self.ax.set(xlabel='Time (s)', ylabel='Amplitude', title='Recording')
+        self.ax.axhline(y=0, color='black', linewidth=0.5, linestyle='--')
+        self.ax.grid(True, linestyle=':', alpha=0.5)
+        self.setup_span_selector()
         
         main_layout.addLayout(control_row)
         main_layout.addWidget(self.toolbar)
@@ -236,21 +237,37 @@ class Record(QWidget):
             return fallback
 
 
+    def probe_microphone(self):
+        """Open and close an input stream without recording anything"""
+        sd.query_devices(kind='input')
+        with sd.InputStream(samplerate=self.fs, channels=1, dtype='float32'):
+            pass
+
+    def _background_mic_probe(self):
+        """Run the microphone probe off the UI thread and remember a success"""
+        try:
+            self.probe_microphone()
+            self._mic_ok = True
+        except Exception as e:
+            print(f"Background microphone probe failed: {e}")
+
     def check_microphone_permission(self):
         """Check microphone permission and trigger permission dialog if needed"""
+        if self._mic_ok:
+            return True
+        # Don't open the device twice if the startup probe is still running
+        if self._mic_probe.is_alive():
+            self._mic_probe.join()
+            if self._mic_ok:
+                return True
         try:
-            # First, try a simple test that should trigger the permission dialog
+            # Opening an input stream is enough to trigger the permission dialog
             print("Testing microphone access...")
-            
-            # Create a short test recording - this should trigger the permission dialog
-            duration = 0.1  # seconds
-            test_recording = sd.rec(int(duration * self.fs), 
-                                  samplerate=self.fs, 
-                                  channels=1, 
-                                  blocking=True)
+            self.probe_microphone()
             
             # If we get here, we have permission
             print("Microphone access successful!")
+            self._mic_ok = True
             return True
             
         except sd.PortAudioError as e:
@@ -280,38 +297,51 @@ class Record(QWidget):
             self.record_button.setEnabled(False)
             self.stop_button.setEnabled(True)
             self.isrecording = True
-            self.frames = []  # Reset frames
             self.recording_start_time = time.time()
+            self.max_record_time = self.time_spinbox.value()
+            
+            # Allocate the whole recording up front; the callback fills it in place
+            n = self.max_record_time * self.fs
+            self.pcm_buf = np.empty((n, 1), dtype=np.float32)
+            self.pcm_len = 0
+            self._status_flags = 0
+            
+            # PortAudio runs _audio_cb on its own audio thread
+            self.stream = sd.InputStream(samplerate=self.fs,
+                                         channels=1,
+                                         dtype='float32',
+                                         blocksize=self.BLOCKSIZE,
+                                         latency=self.LATENCY,
+                                         callback=self._audio_cb)
+            self.stream.start()
+            print(f"Input stream latency: {self.stream.latency * 1000:.1f} ms")
             
             # Start timers
-            self.timer.start(200)
-            self.max_record_time = self.time_spinbox.value()
+            self._last_secs = 0
+            self.time_label.setText("00:00")
+            self.timer.start(1000)
             self.auto_stop_timer.start(self.max_record_time * 1000)
             
-            # Start recording thread with sounddevice
-            self.recording_thread = SoundDeviceRecordingThread(self.fs)
-            self.recording_thread.frames_ready.connect(self.handle_frames)
-            self.recording_thread.recording_error.connect(self.handle_recording_error)
-            self.recording_thread.start()
-            
         except Exception as e:
             print(f"Error starting recording: {e}")
             self.handle_recording_error(str(e))
 
-    def handle_frames(self, data):
-        """Handle incoming audio frames - runs in main thread"""
-        if self.isrecording:
-            # Convert to int16 for consistency with original code
-            data_int16 = (data * 32767).astype(np.int16)
-            
-            # Store as bytes in frames list
-            self.frames.append(data_int16.tobytes())
-            
-            # Alternative: Store as arrays for more efficient concatenation later
-            # if not hasattr(self, 'frame_arrays'):
-            #     self.frame_arrays = []
-            # self.frame_arrays.append(data_int16)
+    def _audio_cb(self, indata, frames, time, status):
+        """Copy each input block into pcm_buf - runs on the PortAudio thread"""
+        # No printing on the audio thread; update_time_display reports the flags
+        if status:
+            self._status_flags |= int(status)
+        w = self.pcm_len
+        k = min(frames, len(self.pcm_buf) - w)
+        self.pcm_buf[w:w + k] = indata[:k]
+        self.pcm_len = w + k
 
+    def report_stream_status(self):
+        """Log and clear any status flags raised by the audio callback"""
+        flags = self._status_flags
+        if flags:
+            self._status_flags = 0
+            print(f"Audio input status: {sd.CallbackFlags(flags)}")
 
     def handle_recording_error(self, error_msg):
         """Handle recording errors"""
@@ -335,66 +365,95 @@ class Record(QWidget):
         self.timer.stop()
         self.auto_stop_timer.stop()
         
-        # Stop recording thread safely
-        if hasattr(self, 'recording_thread') and self.recording_thread:
-            print("Stopping recording thread...")
-            self.recording_thread.stop()
-            if not self.recording_thread.wait(2000):  # 2 second timeout
-                print("Warning: Recording thread didn't finish in time")
-                self.recording_thread.terminate()
-                self.recording_thread.wait()
-            self.recording_thread = None
+        self.close_input_stream()
         
         print("Processing recording...")
-        # Process recording in main thread
-        QTimer.singleShot(100, self.process_recording)
+        self.process_recording()
         
+    def close_input_stream(self):
+        """Stop the input stream; stop() waits for the last callback to return"""
+        if self.stream is not None:
+            print("Stopping input stream...")
+            try:
+                self.stream.stop()
+                self.stream.close()
+            except Exception as e:
+                print(f"Error closing input stream: {e}")
+            self.stream = None
+            self.report_stream_status()
+
     def update_time_display(self):
-        """Update time display"""
+        """Update time display and report any callback status flags"""
         if self.isrecording:
-            duration = time.time() - self.recording_start_time
-            mins, secs = divmod(int(duration), 60)
+            self.report_stream_status()
+            elapsed = int(time.time() - self.recording_start_time)
+            if elapsed == self._last_secs:
+                return
+            self._last_secs = elapsed
+            mins, secs = divmod(elapsed, 60)
             self.time_label.setText(f"{mins:02d}:{secs:02d}")
 
     def process_recording(self):
         """Process the recorded audio entirely in memory"""
-        try:
-            if not self.frames:
-                print("No frames recorded")
-                return
-                
-            # Convert frames to numpy array directly
-            audio_data = b"".join(self.frames)
-            rec_int = np.frombuffer(audio_data, dtype=np.int16)
-            
-            if len(rec_int) == 0:
-                print("Empty recording")
-                return
-                
-            duration = len(rec_int) / self.fs
-            time_axis = np.linspace(0, duration, len(rec_int))
+        if self.pcm_buf is None or self.pcm_len == 0:
+            print("No frames recorded")
+            return
             
-            # Convert int16 to float32 for processing (normalize to [-1, 1])
-            rec_float = rec_int.astype(np.float32) / 32768.0
+        # Slice the captured samples out of the recording buffer; the worker
+        # copies them into a trimmed array so the full-length buffer can be freed
+        rec_float = self.pcm_buf[:self.pcm_len, 0]
+        self.pcm_buf = None
+        
+        # Decimate on the worker thread so the GUI stays responsive
+        fut = self._pool.submit(self._compute_envelope, rec_float)
+        fut.add_done_callback(self._emit_envelope)
+
+    def _compute_envelope(self, rec_float):
+        """Build the plot envelope for a recording - runs on the worker thread"""
+        # One copy, trimmed to the recorded length; everything handed out
+        # afterwards (selections, ControlMenu) views this array
+        rec_float = rec_float.copy()
+        # Only the decimated envelope is plotted; rec_float keeps full fidelity
+        t_env, y_env = _envelope(rec_float, self.fs)
+        return rec_float, t_env, y_env
+
+    def _emit_envelope(self, fut):
+        """Hand a finished envelope job to the GUI thread"""
+        try:
+            self.envelope_ready.emit(fut)
+        except RuntimeError:
+            pass  # Widget already deleted
+
+    def _finish_plot(self, fut):
+        """Plot a processed recording - runs in main thread"""
+        try:
+            rec_float, t_env, y_env = fut.result()
+            duration = len(rec_float) / self.fs
             
             # Store the audio data in memory instead of saving to file
             self.current_recording_float = rec_float
-            self.current_recording_int = rec_int
             
-            # Update plot
-            self.ax.clear()
-            self.ax.plot(time_axis, rec_int)
-            self.ax.set(xlim=[0, duration], xlabel='Time (s)', ylabel='Amplitude', title='Recording')
-            self.ax.axhline(y=0, color='black', linewidth=0.5, linestyle='--')
-            self.ax.grid(True, linestyle=':', alpha=0.5)
+            # Only the waveform line changes between recordings
+            self.line.set_data(t_env, y_env)
+            self.ax.relim()
+            self.ax.autoscale_view(scalex=False)
+            self.ax.set_xlim(0, duration)
+            
+            # Keep one output stream open so selections start playing immediately
+            self.open_output_stream()
             
-            # Setup span selector
-            self.setup_span_selector(time_axis, rec_float)
+            # Point the span selector at the new recording; drop the old selection
+            self.selectedAudio = None
+            self._current_audio = rec_float
+            self._current_fs = self.fs
+            self.span.clear()
+            self.span.set_active(True)
             
             # Show plot
             self.canvas.setVisible(True)
             self.toolbar.setVisible(True)
-            self.canvas.draw()
+            self.toolbar.update()  # Reset zoom history to the new recording's limits
+            self.canvas.draw_idle()
             self.load_button.setVisible(True)
             
             print(f"Recording processed: {duration:.2f} seconds (in memory)")
@@ -404,34 +463,98 @@ class Record(QWidget):
             QMessageBox.critical(self, "Processing Error", f"Could not process recording:\n{str(e)}")
 
 
-    def setup_span_selector(self, time_axis, audio):
-        """Setup span selector for audio selection"""
-        if hasattr(self, 'span'):
-            try:
-                self.span.disconnect_events()
-            except:
-                pass
-
-        def on_select(xmin, xmax):
-            if len(audio) <= 1:
-                return
-            idx_min = np.argmax(time_axis >= xmin)
-            idx_max = np.argmax(time_axis >= xmax)
-            self.selectedAudio = audio[idx_min:idx_max]
-            # Play selected segment
-            try:
-                sd.play(self.selectedAudio, self.fs)
-            except Exception as e:
-                print(f"Error playing audio: {e}")
-
+    def setup_span_selector(self):
+        """Create the span selector once; on_select reads the current recording"""
+        self._current_audio = None
+        self._current_fs = self.fs
         self.span = SpanSelector(
             self.ax,
-            on_select,
+            self.on_select,
             'horizontal',
             useblit=True,
             interactive=True,
             drag_from_anywhere=True
         )
+        self.span.set_active(False)
+
+    def on_select(self, xmin, xmax):
+        """Select and play the chosen span of the current recording"""
+        audio = self._current_audio
+        if audio is None or len(audio) <= 1:
+            return
+        # Samples are evenly spaced, so map seconds straight to indices
+        n = len(audio)
+        idx_min = min(max(int(round(xmin * self._current_fs)), 0), n)
+        idx_max = min(max(int(round(xmax * self._current_fs)), 0), n)
+        self.selectedAudio = audio[idx_min:idx_max]
+        # Play selected segment
+        self.play_audio(self.selectedAudio)
+
+    def open_output_stream(self):
+        """Open the persistent playback stream if it is not already open"""
+        if self.out_stream is not None:
+            return
+        try:
+            self.out_stream = sd.OutputStream(samplerate=self.fs,
+                                              channels=1,
+                                              dtype='float32',
+                                              blocksize=0,
+                                              latency='low')
+            self.out_stream.start()
+        except Exception as e:
+            print(f"Error opening output stream: {e}")
+            self.out_stream = None
+
+    def play_audio(self, audio):
+        """Play audio on the persistent output stream from a worker thread"""
+        if self.out_stream is None:
+            self.open_output_stream()
+            if self.out_stream is None:
+                return
+        # A newer selection supersedes any playback still in progress
+        self._play_gen += 1
+        threading.Thread(target=self._write_output,
+                         args=(audio.reshape(-1, 1), self._play_gen),
+                         daemon=True).start()
+
+    def _write_output(self, audio, gen, chunk=4096):
+        """Write audio to the output stream in chunks until superseded"""
+        with self._play_lock:
+            stream = self.out_stream
+            if stream is None or gen != self._play_gen:
+                return
+            try:
+                # Drop whatever the previous selection had queued
+                stream.abort()
+                stream.start()
+                for i in range(0, len(audio), chunk):
+                    if gen != self._play_gen:
+                        break
+                    stream.write(audio[i:i + chunk])
+            except Exception as e:
+                print(f"Error playing audio: {e}")
+
+    def close_output_stream(self):
+        """Stop playback and release the output stream"""
+        self._play_gen += 1
+        with self._play_lock:
+            if self.out_stream is not None:
+                try:
+                    self.out_stream.abort()
+                    self.out_stream.close()
+                except Exception as e:
+                    print(f"Error closing output stream: {e}")
+                self.out_stream = None
+
+    def cleanup(self):
+        """Stop any recording and release audio streams when leaving the page"""
+        self.isrecording = False
+        self.timer.stop()
+        self.auto_stop_timer.stop()
+        self.close_input_stream()
+        self.close_output_stream()
+        self._pool.shutdown(wait=False)
+        self.selectedAudio = None
 
     def load_to_controller(self):
         """Load audio to controller from memory"""
@@ -439,7 +562,7 @@ class Record(QWidget):
             if not CONTROL_MENU_AVAILABLE:
                 raise ImportError("ControlMenu is not available")
             
-            if hasattr(self, 'selectedAudio') and len(self.selectedAudio) > 1:
+            if self.selectedAudio is not None and self.selectedAudio.size > 1:
                 audio_to_load = self.selectedAudio
             else:
                 # Use the in-memory recording instead of reading from file
@@ -448,6 +571,9 @@ class Record(QWidget):
                 else:
                     raise ValueError("No recording available in memory")
             
+            # Hand ControlMenu a contiguous float32 array (a no-op for the usual span view)
+            audio_to_load = np.ascontiguousarray(audio_to_load, dtype=np.float32)
+            
             duration = len(audio_to_load) / self.fs
             title = f"Recording {time.strftime('%Y-%m-%d %H:%M')}"
 